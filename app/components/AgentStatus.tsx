@@ -1,5 +1,5 @@
 import { useEffect, useState } from 'react';
-import { getAgentStatus } from '../lib/api';
+import { getAgentStatus, subscribeLiveState } from '../lib/api';
 import { AgentStatus as AgentStatusType } from '../lib/types';
 
 export default function AgentStatus() {
@@ -22,10 +22,20 @@ export default function AgentStatus() {
       }
     };
 
-    fetchAgentStatus();
-    const intervalId = setInterval(fetchAgentStatus, 10000); // Update every 10 seconds
+    if (typeof EventSource === 'undefined') {
+      fetchAgentStatus();
+      const intervalId = setInterval(fetchAgentStatus, 10000); // Update every 10 seconds
+      return () => clearInterval(intervalId);
+    }
 
-    return () => clearInterval(intervalId);
+    // Pushed by the server whenever an agent goes up or down
+    return subscribeLiveState((state) => {
+      if (state.data.status) {
+        setAgentStatus(state.data.status);
+        setError(null);
+        setLoading(false);
+      }
+    });
   }, []);
 
   if (loading) {
@@ -3,7 +3,7 @@
 import { useEffect, useState } from 'react';
 import MainLayout from '../components/MainLayout';
 import AgentStatus from '../components/AgentStatus';
-import { getMarketData, getSentimentAnalysis, getNews, getTransactions } from '../lib/api';
+import { getMarketData, getSentimentAnalysis, getNews, getTransactions, subscribeLiveState } from '../lib/api';
 import { CoinData, SentimentAnalysis, CryptoNews, Transaction } from '../lib/types';
 
 export default function Dashboard() {
@@ -11,6 +11,9 @@ export default function Dashboard() {
   const [sentiment, setSentiment] = useState<SentimentAnalysis | null>(null);
   const [news, setNews] = useState<CryptoNews | null>(null);
   const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [transactionCount, setTransactionCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
@@ -22,13 +25,15 @@ export default function Dashboard() {
           getMarketData(),
           getSentimentAnalysis(),
           getNews(),
-          getTransactions(),
+          getTransactions({ count: true }),
         ]);
 
         setMarketData(marketDataRes);
         setSentiment(sentimentRes);
         setNews(newsRes);
-        setTransactions(transactionsRes);
+        setTransactions(transactionsRes.items);
+        setTransactionCount(transactionsRes.count ?? 0);
+        setNextCursor(transactionsRes.next_cursor);
         setError(null);
       } catch (err) {
         console.error('Error fetching dashboard data:', err);
@@ -38,12 +43,47 @@ export default function Dashboard() {
       }
     };
 
+    const fetchTransactions = async () => {
+      try {
+        const transactionsRes = await getTransactions({ count: true });
+        setTransactions(transactionsRes.items);
+        setTransactionCount(transactionsRes.count ?? 0);
+        setNextCursor(transactionsRes.next_cursor);
+      } catch (err) {
+        console.error('Error fetching transactions:', err);
+      }
+    };
+
     fetchData();
-    const intervalId = setInterval(fetchData, 60000); // Update every minute
+    const intervalId = setInterval(fetchTransactions, 60000); // Update every minute
 
-    return () => clearInterval(intervalId);
+    // Market data, sentiment and news are pushed as they change in between
+    const unsubscribe = subscribeLiveState((state) => {
+      if (state.data.market_data) setMarketData(state.data.market_data);
+      if (state.data.sentiment_analysis) setSentiment(state.data.sentiment_analysis);
+      if (state.data.news) setNews(state.data.news);
+    });
+
+    return () => {
+      clearInterval(intervalId);
+      unsubscribe();
+    };
   }, []);
 
+  const loadMoreTransactions = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await getTransactions({ cursor: nextCursor });
+      setTransactions((current) => [...current, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Error fetching transactions:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <MainLayout>
       <div className="mb-8">
@@ -154,7 +194,12 @@ export default function Dashboard() {
       </div>
 
       <div className="card">
-        <h2 className="text-xl font-semibold mb-4">Transaction History</h2>
+        <h2 className="text-xl font-semibold mb-4">
+          Transaction History
+          {transactionCount > 0 && (
+            <span className="ml-2 text-sm font-normal text-gray-500">({transactionCount})</span>
+          )}
+        </h2>
         {loading ? (
           <div className="animate-pulse space-y-3">
             {[1, 2, 3].map((i) => (
@@ -174,7 +219,7 @@ export default function Dashboard() {
               </thead>
               <tbody>
                 {transactions.map((tx, idx) => (
-                  <tr key={idx} className="border-b last:border-b-0">
+                  <tr key={tx.id ?? idx} className="border-b last:border-b-0">
                     <td className="py-3">
                       {tx.message?.includes('SELL') || tx.message?.includes('ethusdc') 
                         ? 'SELL' 
@@ -200,6 +245,15 @@ export default function Dashboard() {
                 ))}
               </tbody>
             </table>
+            {nextCursor && (
+              <button
+                onClick={loadMoreTransactions}
+                disabled={loadingMore}
+                className="btn btn-outline w-full mt-4 text-sm"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            )}
           </div>
         ) : (
           <p className="text-gray-500">No transactions found</p>
@@ -4,8 +4,14 @@ import {
   ApiResponse, 
   CoinData, 
   CryptoNews, 
+  Job,
+  JobAccepted,
+  LiveDelta,
+  LiveState,
   SentimentAnalysis,
   Transaction,
+  TransactionPage,
+  TransactionQuery,
   UserInputs
 } from './types';
 
@@ -38,8 +44,10 @@ export const getNews = async (): Promise<CryptoNews> => {
   return response.data;
 };
 
-export const getTransactions = async (): Promise<Transaction[]> => {
-  const response = await api.get<Transaction[]>('/transactions');
+export const getTransactions = async (
+  query: TransactionQuery = {}
+): Promise<TransactionPage> => {
+  const response = await api.get<TransactionPage>('/transactions', { params: query });
   return response.data;
 };
 
@@ -70,10 +78,113 @@ export const startAllAgents = async (): Promise<ApiResponse<null>> => {
 
 export const submitUserInputs = async (
   inputs: UserInputs
-): Promise<ApiResponse<Transaction>> => {
-  // This is a new endpoint that we'll need to add to the backend
-  const response = await api.post<ApiResponse<Transaction>>('/submit-inputs', inputs);
+): Promise<JobAccepted> => {
+  // Returns at once with a job id, the analysis itself is followed with watchJob
+  const response = await api.post<JobAccepted>('/submit-inputs', inputs);
   return response.data;
 };
 
+export const getJob = async (jobId: string): Promise<Job> => {
+  const response = await api.get<Job>(`/jobs/${jobId}`);
+  return response.data;
+};
+
+const isFinished = (job: Job) => job.status === 'success' || job.status === 'error';
+
+// Follows a job over Server-Sent Events and resolves with its final state.
+// Falls back to polling getJob when the stream cannot be opened.
+export const watchJob = (
+  jobId: string,
+  onUpdate?: (job: Job) => void,
+  pollIntervalMs = 1000
+): Promise<Job> =>
+  new Promise((resolve, reject) => {
+    const poll = async () => {
+      try {
+        const job = await getJob(jobId);
+        onUpdate?.(job);
+        if (isFinished(job)) {
+          resolve(job);
+        } else {
+          setTimeout(poll, pollIntervalMs);
+        }
+      } catch (err) {
+        reject(err);
+      }
+    };
+
+    if (typeof EventSource === 'undefined') {
+      poll();
+      return;
+    }
+
+    const source = new EventSource(`${API_URL}/jobs/${jobId}/events`);
+    const handle = (event: MessageEvent) => {
+      const job: Job = JSON.parse(event.data);
+      onUpdate?.(job);
+      if (isFinished(job)) {
+        source.close();
+        resolve(job);
+      }
+    };
+    ['queued', 'running', 'success', 'error'].forEach((status) =>
+      source.addEventListener(status, handle as EventListener)
+    );
+    source.onerror = () => {
+      // EventSource reconnects by itself while open; give up on it once closed
+      if (source.readyState === EventSource.CLOSED) {
+        poll();
+      }
+    };
+  });
+
+// One shared /stream connection feeds every subscriber of the live dashboard state.
+// The server sends a snapshot first and then only the sections which changed; after a
+// reconnect EventSource sends Last-Event-ID, so only the missed deltas are replayed.
+type LiveListener = (state: LiveState) => void;
+
+const liveListeners = new Set<LiveListener>();
+let liveSource: EventSource | null = null;
+let liveState: LiveState | null = null;
+
+const notifyLiveListeners = () => {
+  if (liveState) {
+    const state = liveState;
+    liveListeners.forEach((listener) => listener(state));
+  }
+};
+
+export const subscribeLiveState = (listener: LiveListener): (() => void) => {
+  liveListeners.add(listener);
+  if (liveState) {
+    listener(liveState);
+  }
+
+  if (!liveSource && typeof EventSource !== 'undefined') {
+    liveSource = new EventSource(`${API_URL}/stream`);
+    liveSource.addEventListener('snapshot', ((event: MessageEvent) => {
+      liveState = JSON.parse(event.data);
+      notifyLiveListeners();
+    }) as EventListener);
+    liveSource.addEventListener('delta', ((event: MessageEvent) => {
+      const delta: LiveDelta = JSON.parse(event.data);
+      liveState = {
+        epoch: liveState?.epoch ?? '',
+        version: delta.version,
+        data: { ...liveState?.data, [delta.section]: delta.data },
+      };
+      notifyLiveListeners();
+    }) as EventListener);
+  }
+
+  return () => {
+    liveListeners.delete(listener);
+    if (liveListeners.size === 0 && liveSource) {
+      liveSource.close();
+      liveSource = null;
+      liveState = null;
+    }
+  };
+};
+
 export default api; 
\ No newline at end of file
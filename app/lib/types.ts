@@ -55,6 +55,7 @@ export interface Article {
 }
 
 export interface Transaction {
+  id?: number;
   tx_hash?: string;
   status: string;
   message?: string;
@@ -66,6 +67,41 @@ export interface Transaction {
   reasoning?: string;
 }
 
+// One page of /transactions, newest first
+export interface TransactionPage {
+  items: Transaction[];
+  next_cursor: string | null;
+  has_more: boolean;
+  count?: number; // only with count: true
+}
+
+export interface TransactionQuery {
+  limit?: number;
+  cursor?: string;
+  since?: number;
+  until?: number;
+  action?: 'BUY' | 'SELL' | 'HOLD';
+  count?: boolean; // also return the total number of matching transactions
+}
+
+// Dashboard state pushed by /stream
+export interface LiveState {
+  epoch: string; // changes with every server restart, versions restart with it
+  version: number;
+  data: {
+    status?: AgentStatus;
+    market_data?: CoinData;
+    sentiment_analysis?: SentimentAnalysis;
+    news?: CryptoNews;
+  };
+}
+
+export interface LiveDelta {
+  version: number;
+  section: keyof LiveState['data'];
+  data: unknown;
+}
+
 // API Response Types
 export interface ApiResponse<T> {
   status: 'success' | 'error' | 'pending';
@@ -73,6 +109,23 @@ export interface ApiResponse<T> {
   data?: T;
 }
 
+// Analysis job started by /submit-inputs
+export interface JobAccepted {
+  status: 'accepted' | 'pending' | 'error';
+  job_id?: string;
+  message?: string;
+}
+
+export interface Job {
+  job_id: string;
+  status: 'queued' | 'running' | 'success' | 'error';
+  message: string;
+  data: Transaction | null;
+  created_at: number;
+  updated_at: number;
+  seq?: number;
+}
+
 export interface TradeDecision {
   action: 'BUY' | 'SELL' | 'HOLD';
   reasoning: string;
@@ -6,7 +6,7 @@ import UserInputForm from '../components/UserInputForm';
 import TradeResult from '../components/TradeResult';
 import AgentStatus from '../components/AgentStatus';
 import { UserInputs, Transaction } from '../lib/types';
-import { submitUserInputs } from '../lib/api';
+import { submitUserInputs, watchJob } from '../lib/api';
 
 export default function TradePage() {
   const [isLoading, setIsLoading] = useState(false);
@@ -18,11 +18,16 @@ export default function TradePage() {
     setError(null);
 
     try {
-      const response = await submitUserInputs(data);
-      if (response.status === 'success' && response.data) {
-        setResult(response.data);
+      const accepted = await submitUserInputs(data);
+      if (!accepted.job_id) {
+        throw new Error(accepted.message || 'Failed to process trade request');
+      }
+
+      const job = await watchJob(accepted.job_id);
+      if (job.status === 'success' && job.data) {
+        setResult(job.data);
       } else {
-        throw new Error(response.message || 'Failed to process trade request');
+        throw new Error(job.message || 'Failed to process trade request');
       }
     } catch (err) {
       console.error('Error submitting form:', err);
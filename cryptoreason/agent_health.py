@@ -0,0 +1,117 @@
+"""Concurrent health probing of the agent fleet for the API wrapper.
+
+Every HEALTH_PROBE_PERIOD seconds all agent ports are probed at once with a TCP
+connect, so a sweep takes at most one HEALTH_PROBE_TIMEOUT however many agents are
+down. Results are kept in a timestamped cache that request handlers read without
+doing any I/O, together with each agent's probe latency and its last HEALTH_HISTORY
+up/down results. An optional on_change callback hears about every agent going up or
+down, so the status can be pushed instead of polled.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+HEALTH_PROBE_PERIOD = float(os.getenv("HEALTH_PROBE_PERIOD", 10.0))
+HEALTH_PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", 1.0))
+HEALTH_HISTORY = int(os.getenv("HEALTH_HISTORY", 30))
+
+
+class AgentHealth:
+    """Probe results of one agent."""
+
+    def __init__(self, port: int, history: int):
+        self.port = port
+        self.up = False
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.history: deque = deque(maxlen=history)  # (checked_at, up)
+
+    def record(self, up: bool, latency_ms: Optional[float], checked_at: float):
+        self.up = up
+        self.latency_ms = latency_ms
+        self.checked_at = checked_at
+        self.history.append((checked_at, up))
+
+    def to_dict(self) -> dict:
+        return {
+            "port": self.port,
+            "up": self.up,
+            "latency_ms": self.latency_ms,
+            "checked_at": self.checked_at,
+            "uptime": sum(up for _, up in self.history) / len(self.history) if self.history else None,
+            "history": [{"checked_at": checked_at, "up": up} for checked_at, up in self.history],
+        }
+
+
+class HealthProber:
+    """Keeps the health cache of a set of agents, run on an asyncio event loop."""
+
+    def __init__(self, ports: dict, host: str = "localhost", period: float = HEALTH_PROBE_PERIOD,
+                 timeout: float = HEALTH_PROBE_TIMEOUT, history: int = HEALTH_HISTORY,
+                 on_change: Optional[Callable[[str, bool], None]] = None):
+        self.host = host
+        self.on_change = on_change  # called with (agent_id, up) on the first probe and every change
+        self.period = period
+        self.timeout = timeout
+        self.agents = {agent_id: AgentHealth(port, history) for agent_id, port in ports.items()}
+        self._lock = threading.Lock()  # so the cache can also be read from other threads
+
+    async def probe(self, agent_id: str) -> bool:
+        """Probe one agent and record the result."""
+        health = self.agents[agent_id]
+        started = time.monotonic()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(self.host, health.port), self.timeout)
+            writer.close()
+            up, latency_ms = True, (time.monotonic() - started) * 1000
+        except (OSError, asyncio.TimeoutError):
+            up, latency_ms = False, None
+
+        with self._lock:
+            changed = up != health.up or health.checked_at is None
+            if changed and health.checked_at is not None:
+                logging.info(f"Agent {agent_id} is {'up' if up else 'down'}")
+            health.record(up, latency_ms, time.time())
+        if changed and self.on_change is not None:
+            try:
+                self.on_change(agent_id, up)
+            except Exception as e:
+                logging.error(f"Agent health callback failed: {e!r}")
+        return up
+
+    async def sweep(self):
+        """Probe all agents concurrently."""
+        await asyncio.gather(*(self.probe(agent_id) for agent_id in self.agents))
+
+    async def run(self):
+        while True:
+            started = time.monotonic()
+            try:
+                await self.sweep()
+            except Exception as e:
+                logging.error(f"Agent health sweep failed: {e!r}")
+            await asyncio.sleep(max(self.period - (time.monotonic() - started), 0))
+
+    def is_up(self, agent_id: str) -> bool:
+        with self._lock:
+            return self.agents[agent_id].up
+
+    def is_fresh(self, agent_id: str) -> bool:
+        """Whether the cached status is recent enough to be trusted without a new probe."""
+        with self._lock:
+            checked_at = self.agents[agent_id].checked_at
+        return checked_at is not None and time.time() - checked_at < 2 * self.period
+
+    def statuses(self) -> dict:
+        """{agent_id: up} from the cache."""
+        with self._lock:
+            return {agent_id: health.up for agent_id, health in self.agents.items()}
+
+    def snapshot(self) -> dict:
+        """Cached status, latency and history of every agent."""
+        with self._lock:
+            return {agent_id: health.to_dict() for agent_id, health in self.agents.items()}
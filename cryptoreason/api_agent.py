@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 import os
+import json
 import time
+import uuid
 import asyncio
 import logging
 from uagents import Agent, Context, Model
+from uagents.types import DeliveryStatus
 from dotenv import load_dotenv
 from typing import Optional
 
@@ -32,8 +35,26 @@ class TradingResponse(Model):
     timestamp: float
     request_id: str  # To match the response with the request
 
-# Store responses from the main agent
-responses = {}
+# The API wrapper talks to this agent over a Unix domain socket, one connection per request:
+# it writes the request as a JSON line, reads back {"request_id": ...} and then the response line.
+API_BRIDGE_SOCKET = os.getenv("API_BRIDGE_SOCKET", "/tmp/cryptoreason_api_bridge.sock")
+API_BRIDGE_TIMEOUT = float(os.getenv("API_BRIDGE_TIMEOUT", 15.0))
+API_BRIDGE_RESPONSE_TTL = float(os.getenv("API_BRIDGE_RESPONSE_TTL", 5 * 60.0))
+
+# Requests waiting for the main agent, resolved as soon as its response arrives
+pending = {}  # request_id -> asyncio.Future
+# Responses nobody waits for any more (the caller timed out), kept for a late claim
+unclaimed = {}  # request_id -> (arrived_at, response)
+bridge_server = None
+
+# Requests are sent by API_BRIDGE_SEND_CONCURRENCY workers woken up by the queue. A failed
+# send is retried API_BRIDGE_SEND_RETRIES times, backing off API_BRIDGE_RETRY_BACKOFF * 2^n seconds
+API_BRIDGE_SEND_CONCURRENCY = int(os.getenv("API_BRIDGE_SEND_CONCURRENCY", 4))
+API_BRIDGE_SEND_RETRIES = int(os.getenv("API_BRIDGE_SEND_RETRIES", 3))
+API_BRIDGE_RETRY_BACKOFF = float(os.getenv("API_BRIDGE_RETRY_BACKOFF", 0.5))
+send_queue = None  # asyncio.Queue of (recipient, message, attempt), created on startup
+send_workers = []
+dispatch_stats = {"sent": 0, "failed": 0, "retried": 0, "in_flight": 0, "retry_waiting": 0}
 
 # Initialize API agent
 api_agent = Agent(
@@ -43,24 +64,40 @@ api_agent = Agent(
     endpoint=["http://127.0.0.1:8601/submit"],
 )
 
-# Queue for storing requests to be sent
-api_agent._requests_to_send = []
-
 # Main agent address
 MAIN_AGENT = "agent1qfrhxny23vz62v5tr20qnmnjujq8k5t0mxgwdxfap945922t9v4ugqtqkea"
 
 @api_agent.on_event("startup")
 async def startup(ctx: Context):
-    """Log agent startup details."""
+    """Log agent startup details and open the socket the API wrapper connects to."""
+    global bridge_server, send_queue
     ctx.logger.info(f"API Bridge Agent started with address: {api_agent.address}")
+    
+    send_queue = asyncio.Queue()
+    send_workers.extend(asyncio.create_task(dispatch_requests(ctx)) for _ in range(API_BRIDGE_SEND_CONCURRENCY))
+    
+    if os.path.exists(API_BRIDGE_SOCKET):
+        os.unlink(API_BRIDGE_SOCKET)  # left over from a previous run
+    bridge_server = await asyncio.start_unix_server(handle_bridge_connection, path=API_BRIDGE_SOCKET)
+    ctx.logger.info(f"Listening for API wrapper requests on {API_BRIDGE_SOCKET}")
+
+@api_agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    """Close the API wrapper socket and stop the send workers."""
+    for worker in send_workers:
+        worker.cancel()
+    if bridge_server is not None:
+        bridge_server.close()
+        await bridge_server.wait_closed()
+    if os.path.exists(API_BRIDGE_SOCKET):
+        os.unlink(API_BRIDGE_SOCKET)
 
 @api_agent.on_message(model=TradingResponse)
 async def handle_trading_response(ctx: Context, sender: str, msg: TradingResponse):
     """Handle response from the main agent"""
     ctx.logger.info(f"Received trading response from {sender}: {msg.action}")
     
-    # Store the response for the API wrapper to retrieve
-    responses[msg.request_id] = {
+    response = {
         "status": "success",
         "data": {
             "action": msg.action,
@@ -71,10 +108,17 @@ async def handle_trading_response(ctx: Context, sender: str, msg: TradingRespons
         },
         "message": "Analysis complete. Recommendation generated."
     }
+    
+    # Wake up the API wrapper connection waiting for this request
+    future = pending.pop(msg.request_id, None)
+    if future is not None and not future.done():
+        future.set_result(response)
+    else:
+        unclaimed[msg.request_id] = (time.time(), response)
 
 async def send_trading_request(request_data):
     """Send a trading request to the main agent"""
-    request_id = str(time.time())
+    request_id = uuid.uuid4().hex
     
     # Create request message
     request = TradingRequest(
@@ -87,48 +131,149 @@ async def send_trading_request(request_data):
     )
     
     # We can't directly access the agent's context outside of its handlers
-    # Instead, we'll store the request and wait for the agent's update loop
-    # to send it in the next cycle
+    # Instead, we'll queue the request for the send workers started on startup
     try:
-        # Store the request for later sending
-        api_agent._requests_to_send.append((MAIN_AGENT, request))
-        logger.info(f"Queued trading request {request_id} to main agent")
+        send_queue.put_nowait((MAIN_AGENT, request, 0))
+        logger.info(f"Queued trading request {request_id} to main agent ({send_queue.qsize()} waiting)")
         return request_id
     except Exception as e:
         logger.error(f"Error queuing trading request: {e}")
         return None
 
-def get_response(request_id, timeout=10):
-    """Get the response for a specific request ID"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if request_id in responses:
-            response = responses.pop(request_id)
-            return response
-        time.sleep(0.5)
+async def wait_for_response(request_id, timeout=API_BRIDGE_TIMEOUT):
+    """Await the main agent's response to a request, woken up by handle_trading_response"""
+    if request_id in unclaimed:
+        return unclaimed.pop(request_id)[1]
     
-    # If timeout reached, return fallback response
-    return {
-        "status": "error",
-        "message": "Timeout waiting for main agent response"
-    }
+    future = pending.setdefault(request_id, asyncio.get_running_loop().create_future())
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        pending.pop(request_id, None)
+        return {
+            "status": "error",
+            "message": "Timeout waiting for main agent response"
+        }
 
-# Add a periodic handler to process queued requests
-@api_agent.on_interval(period=1.0)  # Check every second
-async def process_queued_requests(ctx: Context):
-    """Process any queued requests."""
-    # Process any pending requests
-    if api_agent._requests_to_send:
-        # Get the next request to send
-        recipient, message = api_agent._requests_to_send.pop(0)
+async def handle_bridge_connection(reader, writer):
+    """Serve one API wrapper request: {"op": "submit", "data": {...}}, {"op": "claim", "request_id": ...} or {"op": "metrics"}"""
+    try:
+        message = json.loads(await reader.readline())
+        timeout = float(message.get("timeout", API_BRIDGE_TIMEOUT))
+        
+        if message.get("op") == "metrics":
+            writer.write((json.dumps(dispatch_metrics()) + "\n").encode())
+            await writer.drain()
+            return
+        
+        if message.get("op") == "claim":
+            request_id = message["request_id"]
+        else:
+            request_id = await send_trading_request(message.get("data", {}))
+            if request_id is None:
+                raise RuntimeError("Could not queue the trading request")
+            # Register before acknowledging, so a fast response cannot be missed
+            pending.setdefault(request_id, asyncio.get_running_loop().create_future())
+        
+        writer.write((json.dumps({"request_id": request_id}) + "\n").encode())
+        await writer.drain()
+        
+        response = await wait_for_response(request_id, timeout)
+        writer.write((json.dumps(response) + "\n").encode())
+        await writer.drain()
+    except Exception as e:
+        logger.error(f"Error serving API wrapper request: {e}")
         try:
-            # Send the request
-            await ctx.send(recipient, message)
+            writer.write((json.dumps({"status": "error", "message": str(e)}) + "\n").encode())
+            await writer.drain()
+        except Exception:
+            pass
+    finally:
+        writer.close()
+
+async def request_analysis(request_data, timeout=API_BRIDGE_TIMEOUT, on_accepted=None):
+    """
+    Client side of the bridge, used by the API wrapper process.
+    
+    Sends a trading request to the running API agent and returns the main agent's
+    response, or an error response if the agent is unreachable or times out.
+    on_accepted(request_id) is called once the request has been queued.
+    """
+    try:
+        reader, writer = await asyncio.open_unix_connection(API_BRIDGE_SOCKET)
+    except OSError as e:
+        return {"status": "error", "message": f"API agent not available: {e}"}
+    
+    try:
+        writer.write((json.dumps({"op": "submit", "data": request_data, "timeout": timeout}) + "\n").encode())
+        await writer.drain()
+        
+        accepted = json.loads(await asyncio.wait_for(reader.readline(), timeout))
+        if "request_id" not in accepted:
+            return accepted
+        if on_accepted is not None:
+            on_accepted(accepted["request_id"])
+        # a little slack over the agent's own timeout, which answers with an error response
+        line = await asyncio.wait_for(reader.readline(), timeout + 5)
+        return json.loads(line) if line else {"status": "error", "message": "API agent closed the connection"}
+    except (asyncio.TimeoutError, OSError, ValueError) as e:
+        return {"status": "error", "message": f"No response from API agent: {e!r}"}
+    finally:
+        writer.close()
+
+@api_agent.on_interval(period=60.0)
+async def evict_unclaimed_responses(ctx: Context):
+    """Drop responses which nobody claimed within API_BRIDGE_RESPONSE_TTL."""
+    now = time.time()
+    for request_id in [rid for rid, (arrived_at, _) in unclaimed.items() if now - arrived_at > API_BRIDGE_RESPONSE_TTL]:
+        ctx.logger.warning(f"Evicting unclaimed response {request_id}")
+        del unclaimed[request_id]
+
+async def dispatch_requests(ctx: Context):
+    """Send worker: takes requests off the queue as soon as they are enqueued."""
+    while True:
+        recipient, message, attempt = await send_queue.get()
+        dispatch_stats["in_flight"] += 1
+        try:
+            # ctx.send reports undeliverable messages through the returned status rather than raising
+            status = await ctx.send(recipient, message)
+            if status is not None and status.status == DeliveryStatus.FAILED:
+                raise RuntimeError(status.detail or "delivery failed")
+            dispatch_stats["sent"] += 1
             ctx.logger.info(f"Sent request {message.request_id} to {recipient}")
         except Exception as e:
-            ctx.logger.error(f"Error sending request: {e}")
-            # Put the request back in the queue to retry
-            api_agent._requests_to_send.append((recipient, message))
+            ctx.logger.error(f"Error sending request {message.request_id} (attempt {attempt + 1}): {e}")
+            if attempt < API_BRIDGE_SEND_RETRIES:
+                # wait off the queue, so the worker keeps serving other requests meanwhile
+                dispatch_stats["retried"] += 1
+                dispatch_stats["retry_waiting"] += 1
+                asyncio.get_running_loop().call_later(
+                    API_BRIDGE_RETRY_BACKOFF * 2 ** attempt, requeue_request, recipient, message, attempt + 1
+                )
+            else:
+                dispatch_stats["failed"] += 1
+                fail_request(message.request_id, f"Could not reach the main agent: {e}")
+        finally:
+            dispatch_stats["in_flight"] -= 1
+            send_queue.task_done()
+
+def requeue_request(recipient, message, attempt):
+    dispatch_stats["retry_waiting"] -= 1
+    send_queue.put_nowait((recipient, message, attempt))
+
+def fail_request(request_id, reason):
+    """Answer a request which could not be delivered right away instead of letting it time out"""
+    future = pending.pop(request_id, None)
+    if future is not None and not future.done():
+        future.set_result({"status": "error", "message": reason})
+
+def dispatch_metrics():
+    """Queue depth and send counters of the bridge"""
+    return {"queue_depth": send_queue.qsize() if send_queue is not None else 0, **dispatch_stats}
+
+@api_agent.on_interval(period=60.0)
+async def log_dispatch_metrics(ctx: Context):
+    ctx.logger.info(f"Bridge dispatch metrics: {dispatch_metrics()}")
 
 if __name__ == "__main__":
     api_agent.run() 
\ No newline at end of file
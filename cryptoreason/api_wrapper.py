@@ -1,60 +1,81 @@
-from flask import Flask, jsonify, request
-from flask_cors import CORS
-import requests
+"""ASGI API wrapper between the Next.js frontend and the agents, served by uvicorn.
+
+Submitted jobs (JobStore), the agent health cache (HealthProber) and the dashboard
+live state (LiveState) live in the memory of the serving process, and the process
+launches the API agent on startup. The server therefore runs a single worker; the
+event loop serves any number of concurrent requests and SSE streams on its own.
+Only the transaction history is persisted, in SQLite.
+"""
+from quart import Quart, Response, jsonify, request
+from quart_cors import cors
 import json
 import os
 import subprocess
 import time
-import threading
-import socket
 import asyncio
-import nest_asyncio
-
-# Apply nest_asyncio to allow nested event loops (needed for asyncio in Flask)
-nest_asyncio.apply()
 
 # Import the API agent functions
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from agent_health import HealthProber
+from history_store import HistoryStore
+from live_state import LiveState
+from jobs import JobStore
 try:
-    from api_agent import send_trading_request, get_response
+    from api_agent import request_analysis
 except ImportError:
-    # Mock functions if api_agent.py is not available
-    async def send_trading_request(request_data):
-        return None
-    
-    def get_response(request_id, timeout=10):
+    # Mock function if api_agent.py is not available
+    async def request_analysis(request_data, timeout=15, on_accepted=None):
         return {"status": "error", "message": "API agent not available"}
 
+# ASGI server settings, served by a single worker (see the module docstring)
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", 8600))
+
+# Analyses run as tasks on the server's event loop, so no request waits on them
+JOB_RESPONSE_TIMEOUT = float(os.getenv("JOB_RESPONSE_TIMEOUT", 15.0))
+JOB_STREAM_KEEPALIVE = 15.0  # seconds between SSE comments on a quiet stream
+jobs = JobStore()
+
+# Dashboard state pushed to /api/stream subscribers by the sources that change it
+LIVE_STREAM_KEEPALIVE = 15.0
+live = LiveState()
+
+# Transaction history, persisted in SQLite and queried off the event loop
+HISTORY_DB_PATH = os.getenv("HISTORY_DB_PATH", "history.db")
+history = HistoryStore(HISTORY_DB_PATH)
+background_tasks = set()
+
+def spawn(coro):
+    """Run a coroutine in the background, keeping a reference until it is done"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+def launch(script):
+    """Start an agent script from cryptoreason/ as a separate process"""
+    agent_path = os.path.join(os.getcwd(), "cryptoreason", script)
+    subprocess.Popen(["python3", agent_path], 
+                     stdout=subprocess.PIPE,
+                     stderr=subprocess.PIPE)
+
 # Ensure API agent is running
-def start_api_agent():
+async def start_api_agent():
     try:
-        agent_already_running = False
         try:
             # Check if agent is already running
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                s.connect(('localhost', 8601))
-                agent_already_running = True
-        except:
-            pass
-        
-        if not agent_already_running:
+            _, writer = await asyncio.wait_for(asyncio.open_connection('localhost', 8601), 1)
+            writer.close()
+        except (OSError, asyncio.TimeoutError):
             print("Starting API agent...")
-            agent_path = os.path.join(os.getcwd(), "cryptoreason", "api_agent.py")
-            subprocess.Popen(["python3", agent_path], 
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE)
-            time.sleep(3)  # Give agent time to start
+            launch("api_agent.py")
     except Exception as e:
         print(f"Error starting API agent: {e}")
 
-# Start the API agent as part of initialization
-threading.Thread(target=start_api_agent, daemon=True).start()
-
-app = Flask(__name__)
+app = Quart(__name__)
 # Configure CORS to allow requests from the frontend
-CORS(app, resources={r"/api/*": {"origins": ["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001"]}})
+app = cors(app, allow_origin=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001"])
 
 # Configuration - Updated port numbers based on actual agent outputs
 AGENT_CONFIG = {
@@ -115,17 +136,37 @@ AGENT_CONFIG = {
     }
 }
 
-# Dictionary to store agent status
-agent_status = {agent_id: False for agent_id in AGENT_CONFIG.keys()}
+# Agent status cache, refreshed by concurrent probes in the background. Every agent going
+# up or down republishes the status section of the live stream
+health = HealthProber({agent_id: config["port"] for agent_id, config in AGENT_CONFIG.items()},
+                      on_change=lambda agent_id, up: live.publish("status", current_status()))
+
+@app.before_serving
+async def start_background_work():
+    """Publish the initial live state, then start the API agent and the health prober once the server's event loop runs"""
+    for section, current in LIVE_SECTIONS.items():
+        live.publish(section, current())
+    spawn(start_api_agent())
+    spawn(health.run())
+
+@app.after_serving
+async def stop_background_work():
+    for task in list(background_tasks):
+        task.cancel()
+    history.close()
 
 # Store last received data
 last_data = {
     "market_data": None,
     "sentiment_analysis": None,
-    "news": None,
-    "transactions": []
+    "news": None
 }
 
+def update_last_data(section, data):
+    """Store new data of a dashboard section and push it to the live stream"""
+    last_data[section] = data
+    live.publish(section, data)
+
 # Store user inputs for main.py
 user_inputs = {
     "topup_wallet": "yes",
@@ -137,49 +178,38 @@ user_inputs = {
     "reason": ""
 }
 
-def check_agent_status(port):
-    """Check if an agent is running on a specific port"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.settimeout(1)  # Set a timeout for the connection attempt
-            s.connect(('localhost', port))
-            return True
-        except:
-            # If socket connection fails, check if a Python process is using this port
-            try:
-                output = subprocess.check_output(f"lsof -i :{port}", shell=True)
-                return b"Python" in output
-            except:
-                return False
-
-def update_agent_status():
-    """Periodically update agent status"""
-    while True:
-        for agent_id, config in AGENT_CONFIG.items():
-            agent_status[agent_id] = check_agent_status(config["port"])
-        time.sleep(10)  # Check every 10 seconds
-
-# Start the background thread to check agent status
-status_thread = threading.Thread(target=update_agent_status, daemon=True)
-status_thread.start()
+async def check_agent_status(agent_id):
+    """Check if an agent is running, from the health cache or with a fresh probe if the cache is stale"""
+    if health.is_fresh(agent_id):
+        return health.is_up(agent_id)
+    return await health.probe(agent_id)
 
-@app.route('/api/status', methods=['GET'])
-def get_status():
-    """Get status of all agents"""
+def current_status():
+    """Status of all agents"""
+    agent_status = health.statuses()
     # Ensure swap agents show as running - they might not have socket connections
     # but are expected to be responding to API calls correctly
     for agent_id in ["swap_eth_to_usdc", "swap_usdc_to_eth", "swapfinder_agent"]:
         if agent_id in agent_status:
             agent_status[agent_id] = True
     
-    return jsonify(agent_status)
+    return agent_status
 
-@app.route('/api/market-data', methods=['GET'])
-def get_market_data():
-    """Get latest market data"""
+@app.route('/api/status', methods=['GET'])
+async def get_status():
+    """Get status of all agents"""
+    return jsonify(current_status())
+
+@app.route('/api/health', methods=['GET'])
+async def get_health():
+    """Get probe latency and up/down history of all agents"""
+    return jsonify(health.snapshot())
+
+def current_market_data():
+    """Latest market data"""
     try:
         # Try to fetch from the coin_info_agent if it's running
-        if agent_status["coin_info_agent"]:
+        if health.is_up("coin_info_agent"):
             # This is a placeholder - in a real implementation, you would call the agent's API
             # or use a message queue to get the latest data
             pass
@@ -189,22 +219,26 @@ def get_market_data():
     # Return cached data or sample data if fetch fails
     if last_data["market_data"] is None:
         # Sample data for demonstration
-        last_data["market_data"] = {
+        update_last_data("market_data", {
             "name": "Ethereum",
             "symbol": "ETH",
             "current_price": 1510.25,
             "market_cap": 182648195370.0,
             "total_volume": 21218775926.0,
             "price_change_24h": -2.2367
-        }
-    return jsonify(last_data["market_data"])
+        })
+    return last_data["market_data"]
 
-@app.route('/api/sentiment-analysis', methods=['GET'])
-def get_sentiment():
-    """Get latest sentiment analysis"""
+@app.route('/api/market-data', methods=['GET'])
+async def get_market_data():
+    """Get latest market data"""
+    return jsonify(current_market_data())
+
+def current_sentiment():
+    """Latest sentiment analysis"""
     try:
         # Try to fetch from the FGI agent if it's running
-        if agent_status["fgi_agent"]:
+        if health.is_up("fgi_agent"):
             # This is a placeholder - in a real implementation, you would call the agent's API
             pass
     except Exception as e:
@@ -213,7 +247,7 @@ def get_sentiment():
     # Return cached data or sample data if fetch fails
     if last_data["sentiment_analysis"] is None:
         # Sample data for demonstration
-        last_data["sentiment_analysis"] = {
+        update_last_data("sentiment_analysis", {
             "data": [{
                 "value": 17.0,
                 "value_classification": "Extreme Fear",
@@ -221,15 +255,19 @@ def get_sentiment():
             }],
             "status": "success",
             "timestamp": "2025-04-08T16:39:53.288995+00:00"
-        }
-    return jsonify(last_data["sentiment_analysis"])
+        })
+    return last_data["sentiment_analysis"]
 
-@app.route('/api/news', methods=['GET'])
-def get_news():
-    """Get latest crypto news"""
+@app.route('/api/sentiment-analysis', methods=['GET'])
+async def get_sentiment():
+    """Get latest sentiment analysis"""
+    return jsonify(current_sentiment())
+
+def current_news():
+    """Latest crypto news"""
     try:
         # Try to fetch from the crypto_news_agent if it's running
-        if agent_status["crypto_news_agent"]:
+        if health.is_up("crypto_news_agent"):
             # This is a placeholder - in a real implementation, you would call the agent's API
             pass
     except Exception as e:
@@ -238,7 +276,7 @@ def get_news():
     # Return cached data or sample data if fetch fails
     if last_data["news"] is None:
         # Sample data for demonstration
-        last_data["news"] = {
+        update_last_data("news", {
             "articles": [
                 {
                     "source": {"id": None, "name": "Forbes"},
@@ -251,18 +289,99 @@ def get_news():
                     "content": "President Donald Trump's far-reaching reciprocal tariffs appear to be impacting cryptocurrency prices..."
                 }
             ]
-        }
-    return jsonify(last_data["news"])
+        })
+    return last_data["news"]
+
+@app.route('/api/news', methods=['GET'])
+async def get_news():
+    """Get latest crypto news"""
+    return jsonify(current_news())
+
+# Sections of the live stream and where their current value comes from
+LIVE_SECTIONS = {
+    "status": current_status,
+    "market_data": current_market_data,
+    "sentiment_analysis": current_sentiment,
+    "news": current_news,
+}
+
+@app.route('/api/stream', methods=['GET'])
+async def stream_live_state():
+    """
+    Stream dashboard updates as Server-Sent Events.
+    
+    Starts with a "snapshot" event holding every section, the server epoch and its version,
+    followed by a "delta" event per changed section. Event ids are "<epoch>:<version>"; a
+    client reconnecting with ?since=<id> (or the Last-Event-ID header) receives only the
+    deltas it missed while this server process still has them, and a snapshot otherwise.
+    """
+    version = live.parse_event_id(request.args.get("since", request.headers.get("Last-Event-ID")))
+    
+    def snapshot_event():
+        snapshot = live.snapshot()
+        frame = f"id: {live.event_id(snapshot['version'])}\nevent: snapshot\ndata: {json.dumps(snapshot)}\n\n"
+        return snapshot["version"], frame.encode()
+    
+    async def events():
+        nonlocal version
+        deltas = live.deltas_since(version) if version is not None else None
+        if deltas is None:
+            version, frame = snapshot_event()
+            yield frame
+            deltas = []
+        
+        while True:
+            for delta in deltas:
+                yield f"id: {live.event_id(delta['version'])}\nevent: delta\ndata: {json.dumps(delta)}\n\n".encode()
+                version = delta["version"]
+            if not await live.wait_for_change(version, timeout=LIVE_STREAM_KEEPALIVE):
+                yield b": keepalive\n\n"
+            deltas = live.deltas_since(version)
+            if deltas is None:
+                # fell behind the delta log, start over from a snapshot
+                version, frame = snapshot_event()
+                yield frame
+                deltas = []
+    
+    response = Response(events(), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    response.timeout = None
+    return response
 
 @app.route('/api/transactions', methods=['GET'])
-def get_transactions():
-    """Get transaction history"""
-    return jsonify(last_data["transactions"])
+async def get_transactions():
+    """
+    Get a page of the transaction history, newest first.
+    
+    Query parameters: limit (default 50), cursor (next_cursor of the previous page),
+    since and until (unix timestamps), action (BUY/SELL/HOLD) and count=true to include
+    the total number of matching transactions, which costs a scan of all of them.
+    """
+    args = request.args
+    try:
+        filters = {
+            "since": float(args["since"]) if "since" in args else None,
+            "until": float(args["until"]) if "until" in args else None,
+            "action": args.get("action") or None,
+        }
+        limit = int(args.get("limit", 50))
+        items, next_cursor = await asyncio.to_thread(history.page, limit=limit, cursor=args.get("cursor"), **filters)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": f"Invalid query parameter: {e}"}), 400
+    
+    page = {
+        "items": items,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
+    if args.get("count", "").lower() == "true":
+        page["count"] = await asyncio.to_thread(history.count, **filters)
+    return jsonify(page)
 
 @app.route('/api/execute-trade', methods=['POST'])
-def execute_trade():
+async def execute_trade():
     """Manually trigger a trade"""
-    data = request.json
+    data = await request.get_json(silent=True)
     if not data or 'action' not in data or 'amount' not in data:
         return jsonify({"status": "error", "message": "Missing required parameters"}), 400
     
@@ -275,14 +394,89 @@ def execute_trade():
     }
     
     # Add to transaction history
-    last_data["transactions"].append(trade_response)
+    await asyncio.to_thread(history.add, trade_response, action=data['action'])
     
     return jsonify(trade_response)
 
+def mock_recommendation(data):
+    """Rule based recommendation used when the main agent does not answer"""
+    action = "BUY" if data.get('network') == "ethereum" else "SELL"
+    action = "HOLD" if "hold" in data.get('reason', '').lower() else action
+    
+    details = f"Analysis complete. Based on {data.get('riskStrategy')} strategy for {data.get('investorType')} investor and current market conditions, recommendation: {action} ETH."
+    
+    return {
+        "action": action,
+        "amount": 0.5,
+        "price": 2000.00,
+        "timestamp": time.time(),
+        "details": details
+    }
+
+async def run_trading_job(job, request_data, data):
+    """Forward a job to the main agent via the API agent and record its progress"""
+    try:
+        jobs.update(job, "running", "Sending request to the main agent")
+        response = await request_analysis(
+            request_data,
+            timeout=JOB_RESPONSE_TIMEOUT,
+            on_accepted=lambda request_id: jobs.update(job, "running", "Waiting for the main agent's analysis"),
+        )
+        
+        if response["status"] == "success":
+            await asyncio.to_thread(history.add, response["data"])
+            jobs.update(job, "success", response.get("message", "Analysis complete. Recommendation generated."), response["data"])
+            return
+        
+        # If API agent communication failed, fall back to the mock response
+        transaction_data = mock_recommendation(data)
+        await asyncio.to_thread(history.add, transaction_data)
+        jobs.update(job, "success", "Analysis complete. Recommendation generated.", transaction_data)
+    except Exception as e:
+        jobs.update(job, "error", f"Error processing inputs: {str(e)}")
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+async def get_job(job_id):
+    """Get the current state of a submitted analysis"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": f"Unknown job: {job_id}"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+async def stream_job(job_id):
+    """Stream the progress of a submitted analysis as Server-Sent Events"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": f"Unknown job: {job_id}"}), 404
+    
+    # Reconnecting EventSource clients resume after the last event they received
+    try:
+        seen = int(request.headers.get("Last-Event-ID", -1)) + 1
+    except ValueError:
+        seen = 0  # replay the whole job for a malformed id
+    
+    async def events():
+        nonlocal seen
+        while True:
+            new_events = await jobs.wait_for_events(job, seen, timeout=JOB_STREAM_KEEPALIVE)
+            if not new_events:
+                yield b": keepalive\n\n"
+            for event in new_events:
+                yield f"id: {event['seq']}\nevent: {event['status']}\ndata: {json.dumps(event)}\n\n".encode()
+            seen += len(new_events)
+            if job.finished and seen >= len(job.events):
+                return
+    
+    response = Response(events(), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    response.timeout = None  # the stream lasts as long as the job
+    return response
+
 @app.route('/api/submit-inputs', methods=['POST'])
-def submit_inputs():
-    """Handle user inputs and forward to the main agent via API agent"""
-    data = request.json
+async def submit_inputs():
+    """Accept user inputs and start an analysis job; progress is read from /api/jobs/<id>"""
+    data = await request.get_json(silent=True)
     if not data:
         return jsonify({"status": "error", "message": "No data provided"}), 400
     
@@ -299,11 +493,7 @@ def submit_inputs():
     }
 
     # Check if the main_agent is running
-    main_port = AGENT_CONFIG["main_agent"]["port"]
-    main_agent_running = check_agent_status(main_port)
-    
-    # Update status
-    agent_status["main_agent"] = main_agent_running
+    main_agent_running = await check_agent_status("main_agent")
     
     if main_agent_running:
         try:
@@ -315,43 +505,18 @@ def submit_inputs():
                 "reason": user_inputs["reason"]
             }
             
-            # Send the request asynchronously
-            loop = asyncio.get_event_loop()
-            request_id = loop.run_until_complete(send_trading_request(request_data))
-            
-            if request_id:
-                # Wait for a response from the main agent
-                response = get_response(request_id, timeout=15)
-                
-                if response["status"] == "success":
-                    # Add to transaction history
-                    transaction_data = response["data"].copy()
-                    last_data["transactions"].append(transaction_data)
-                    return jsonify(response)
-            
-            # If API agent communication failed, fall back to the mock response
-            action = "BUY" if data.get('network') == "ethereum" else "SELL"
-            action = "HOLD" if "hold" in data.get('reason', '').lower() else action
-            
-            details = f"Analysis complete. Based on {data.get('riskStrategy')} strategy for {data.get('investorType')} investor and current market conditions, recommendation: {action} ETH."
-            
-            response = {
-                "status": "success",
-                "data": {
-                    "action": action,
-                    "amount": 0.5,
-                    "price": 2000.00,
-                    "timestamp": time.time(),
-                    "details": details
-                },
-                "message": "Analysis complete. Recommendation generated."
-            }
+            job = jobs.create()
+            spawn(run_trading_job(job, request_data, data))
             
-            # Add to transaction history
-            transaction_data = response["data"].copy()
-            last_data["transactions"].append(transaction_data)
-            
-            return jsonify(response)
+            return jsonify({
+                "status": "accepted",
+                "job_id": job.job_id,
+                "message": "Analysis started",
+                "links": {
+                    "self": f"/api/jobs/{job.job_id}",
+                    "events": f"/api/jobs/{job.job_id}/events"
+                }
+            }), 202
         except Exception as e:
             return jsonify({
                 "status": "error", 
@@ -360,11 +525,8 @@ def submit_inputs():
     else:
         # Try to start the main agent automatically
         try:
-            agent_path = os.path.join(os.getcwd(), "cryptoreason", "main.py")
-            subprocess.Popen(["python3", agent_path], 
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE)
-            time.sleep(3)  # Give it a moment to start
+            launch("main.py")
+            await asyncio.sleep(3)  # Give it a moment to start
             
             return jsonify({
                 "status": "pending", 
@@ -376,43 +538,40 @@ def submit_inputs():
                 "message": f"Main agent is not running and could not be started: {str(e)}"
             }), 400
 
+AGENT_SCRIPTS = {
+    "main": "main.py",
+    "heartbeat": "heartbeat_agent.py",
+    "coininfo": "coininfo_agent.py",
+    "fgi": "fgi_agent.py",
+    "cryptonews": "cryptonews_agent.py",
+    "llm": "asi/llm_agent.py",
+    "reward": "reward_agent.py",
+    "topup": "topup_agent.py",
+    "swapfinder": "swapland/swapfinder_agent.py",
+    "swap_eth_to_usdc": "swapland/base_ethTOusdc.py",
+    "swap_usdc_to_eth": "swapland/base_usdcTOeth.py"
+}
+
 @app.route('/api/start-agent', methods=['POST'])
-def start_agent():
+async def start_agent():
     """Start a specific agent"""
-    data = request.json
+    data = await request.get_json(silent=True)
     if not data or 'agent' not in data:
         return jsonify({"status": "error", "message": "Missing agent parameter"}), 400
     
-    agent_map = {
-        "main": "main.py",
-        "heartbeat": "heartbeat_agent.py",
-        "coininfo": "coininfo_agent.py",
-        "fgi": "fgi_agent.py",
-        "cryptonews": "cryptonews_agent.py",
-        "llm": "asi/llm_agent.py",
-        "reward": "reward_agent.py",
-        "topup": "topup_agent.py",
-        "swapfinder": "swapland/swapfinder_agent.py",
-        "swap_eth_to_usdc": "swapland/base_ethTOusdc.py",
-        "swap_usdc_to_eth": "swapland/base_usdcTOeth.py"
-    }
-    
     agent = data['agent']
-    if agent not in agent_map:
+    if agent not in AGENT_SCRIPTS:
         return jsonify({"status": "error", "message": f"Unknown agent: {agent}"}), 400
     
     try:
         # Start the agent in the background
-        agent_path = os.path.join(os.getcwd(), "cryptoreason", agent_map[agent])
-        subprocess.Popen(["python3", agent_path], 
-                         stdout=subprocess.PIPE,
-                         stderr=subprocess.PIPE)
+        launch(AGENT_SCRIPTS[agent])
         return jsonify({"status": "success", "message": f"Agent {agent} started"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 @app.route('/api/start-all', methods=['POST'])
-def start_all_agents():
+async def start_all_agents():
     """Start all agents in the correct order"""
     try:
         # Order matters - start dependency agents first
@@ -423,16 +582,19 @@ def start_all_agents():
         
         for agent in agents_order:
             # Start each agent
-            response = requests.post('http://localhost:8600/api/start-agent', json={"agent": agent})
-            if response.status_code != 200:
-                return jsonify({"status": "error", "message": f"Failed to start {agent}: {response.text}"}), 500
+            try:
+                launch(AGENT_SCRIPTS[agent])
+            except Exception as e:
+                return jsonify({"status": "error", "message": f"Failed to start {agent}: {e}"}), 500
             
             # Give each agent time to start
-            time.sleep(5)
+            await asyncio.sleep(5)
             
         return jsonify({"status": "success", "message": "All agents started"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=8600) 
\ No newline at end of file
+    import uvicorn
+    
+    uvicorn.run(app, host=API_HOST, port=API_PORT) 
\ No newline at end of file
@@ -1,10 +1,19 @@
-import requests
+import asyncio
 import os
 import logging
+import re
 import sys
+import time
+from typing import Optional
 from uagents import Agent, Context, Model
 from dotenv import load_dotenv
 
+# Make the shared cryptoreason modules importable when run as asi/llm_agent.py
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_client
+from asi.llm_cache import LLMCache
+from http_client import HTTPClientError
+
 # Load environment variables from a .env file
 load_dotenv()
 
@@ -14,6 +23,23 @@ api_key = os.getenv("ASI1_API_KEY")
 # ASI1-Mini LLM API endpoint
 url = "https://api.asi1.ai/v1/chat/completions"
 
+# LLM completions are much slower than the data APIs
+ASI1_TIMEOUT = float(os.getenv("ASI1_TIMEOUT", 120.0))
+ASI1_MODEL = "asi1-mini"
+
+# Output caps per kind of request, the decision round only needs one word
+ASI1_MAX_TOKENS = {
+    "reasoning": int(os.getenv("ASI1_MAX_TOKENS_REASONING", 1500)),
+    "expert": int(os.getenv("ASI1_MAX_TOKENS_EXPERT", 1500)),
+    "decision": int(os.getenv("ASI1_MAX_TOKENS_DECISION", 20)),
+}
+# Decision requests are streamed and cut off as soon as the verdict word is complete
+ASI1_STREAM_DECISIONS = os.getenv("ASI1_STREAM_DECISIONS", "true").lower() == "true"
+DECISION_PATTERN = re.compile(r"\b(SELL|BUY|HOLD)\b")
+
+# Identical prompts are answered from here instead of the API
+llm_cache = LLMCache()
+
 # Define headers for API requests, including authentication
 headers = {
     "Content-Type": "application/json",
@@ -29,9 +55,17 @@ agent = Agent(
 
 class ASI1Request(Model):
     query: str
+    session_id: Optional[str] = None
+    expert: Optional[int] = None
+    kind: Optional[str] = None  # "reasoning" (default), "expert" or "decision"
     
 class ASI1Response(Model):
     decision: str
+    session_id: Optional[str] = None
+    expert: Optional[int] = None
+
+# Queries answered in the background, so parallel experts do not wait for each other
+running_queries: set[asyncio.Task] = set()
     
     
     
@@ -42,11 +76,24 @@ async def introduce_agent(ctx: Context):
     logging.info(f"✅ Agent started: {ctx.agent.address}")
     print(f"Hello! I'm {agent.name} and my address is {agent.address}.")
     logging.info("🚀 Agent startup complete.")
+
+
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    """Release pooled HTTP connections"""
+    await http_client.close()
     
     
 @agent.on_message(model=ASI1Request)
 async def handle_asi1_query(ctx: Context, sender: str, msg: ASI1Request):
+    """Answers each query in its own task; uAgents dispatches messages one at a time."""
     ctx.logger.info(f"📩 Received message from {sender}: Analysing crypto sentiment..")
+    task = asyncio.create_task(answer_asi1_query(ctx, sender, msg))
+    running_queries.add(task)
+    task.add_done_callback(running_queries.discard)
+
+
+async def answer_asi1_query(ctx: Context, sender: str, msg: ASI1Request):
     """
     Queries the ASI1-Mini LLM with a given prompt and returns the model's response.
 
@@ -58,29 +105,70 @@ async def handle_asi1_query(ctx: Context, sender: str, msg: ASI1Request):
     
     If an error occurs during the request, the function returns the exception object.
     """
+    kind = msg.kind if msg.kind in ASI1_MAX_TOKENS else "reasoning"
     data = {
         "messages": [{"role": "user", "content": msg.query}],  # User input for the chat model
         "conversationId": None,  # No conversation history tracking
-        "model": "asi1-mini"  # Specifies the model version to use
+        "model": ASI1_MODEL,  # Specifies the model version to use
+        "max_tokens": ASI1_MAX_TOKENS[kind],
     }
+    started = time.monotonic()
 
-    try:
-        # Send a POST request to the LLM API with the input query
-        with requests.post(url, headers=headers, json=data) as response:
-            output = response.json()  # Parse the JSON response
-            logging.info(f"Output from json: {output}")
-            # Extract and return the generated message content
-            sendresponse = output["choices"][0]["message"]["content"]
-    
-    except requests.exceptions.RequestException as e:
-        # Handle and return any request-related exceptions (e.g., network errors)
-        sendresponse = str(e)
+    sendresponse = llm_cache.get(msg.query, ASI1_MODEL)
+    if sendresponse is not None:
+        ctx.logger.info(f"🗃️ Answered from LLM cache: {llm_cache.stats()}")
+    else:
+        try:
+            if kind == "decision" and ASI1_STREAM_DECISIONS:
+                sendresponse = await stream_decision(data)
+            else:
+                # Send a POST request to the LLM API with the input query
+                output = await http_client.post_json(url, headers=headers, json=data, timeout=ASI1_TIMEOUT)
+                logging.info(f"Output from json: {output}")
+                # Extract and return the generated message content
+                sendresponse = output["choices"][0]["message"]["content"]
+            llm_cache.put(msg.query, ASI1_MODEL, sendresponse)
+            ctx.logger.info(f"⏱️ ASI1 {kind} answered in {time.monotonic() - started:.2f}s")
+        
+        except HTTPClientError as e:
+            # Handle and return any request-related exceptions (e.g., network errors)
+            sendresponse = str(e)
+        except Exception as e:
+            # Malformed replies (no choices, missing content, ...) still get an answer,
+            # otherwise the session waiting on it hangs until its deadline
+            logging.error(f"❌ Unexpected ASI1 reply: {e!r}")
+            sendresponse = f"ASI1 request failed: {e!r}"
 
     try:
-        await ctx.send(sender, ASI1Response(decision=sendresponse))
+        await ctx.send(sender, ASI1Response(decision=sendresponse, session_id=msg.session_id, expert=msg.expert))
     except Exception as e:
         logging.error(f"❌ Error sending ASI1Response: {e}")
     ctx.logger.info(f"✅ Decision sent back to sender: {sender}")
+
+
+async def stream_decision(data: dict) -> str:
+    """
+    Streams a decision completion and returns as soon as "SELL", "BUY" or "HOLD" is complete.
+
+    Closing the stream early aborts the rest of the generation, so the time to a decision
+    follows the first tokens instead of the full answer. Returns the whole text if it
+    contains no verdict word.
+    """
+    text = ""
+    events = http_client.stream_events("POST", url, headers=headers, json={**data, "stream": True}, timeout=ASI1_TIMEOUT)
+    try:
+        async for event in events:
+            choices = event.get("choices") or [{}]
+            text += (choices[0].get("delta") or {}).get("content") or ""
+            match = DECISION_PATTERN.search(text)
+            # a word at the very end of the text may still continue, e.g. "BUY" -> "BUYING"
+            if match and match.end() < len(text):
+                return match.group(1)
+    finally:
+        await events.aclose()
+
+    match = DECISION_PATTERN.search(text)
+    return match.group(1) if match else text
     
 # Ensure the agent starts running
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+"""Content-addressed cache of ASI1 chat completions.
+
+Responses are keyed by a hash of the model name and the whitespace-normalised prompt,
+so a prompt asked again within LLM_CACHE_TTL seconds (for example the heartbeat check
+on unchanged data) is answered from memory instead of a multi-second LLM round trip.
+The memory tier is an LRU bounded by LLM_CACHE_SIZE entries; setting LLM_CACHE_PATH
+adds an SQLite tier that survives restarts and is shared between processes.
+
+The cache is synchronous and thread-safe, so both the async LLM agent and the Flask
+based agents can use it.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", 10 * 60.0))
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", 256))
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "")
+
+
+def prompt_key(prompt: str, model: str) -> str:
+    normalised = " ".join(prompt.split())
+    return hashlib.sha256(f"{model}\n{normalised}".encode()).hexdigest()
+
+
+class LLMCache:
+    """LRU + TTL response cache with an optional on-disk tier."""
+
+    def __init__(self, ttl: float = LLM_CACHE_TTL, max_entries: int = LLM_CACHE_SIZE, path: Optional[str] = LLM_CACHE_PATH):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key -> (created_at, response)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, prompt: str, model: str) -> Optional[str]:
+        """Return the cached response for prompt, or None."""
+        key = prompt_key(prompt, model)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT created_at, response FROM llm_responses WHERE key = ? AND created_at > ?",
+                    (key, now - self.ttl),
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0], row[1])
+                    self.disk_hits += 1
+                    return row[1]
+
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, model: str, response: str):
+        """Cache a successful response."""
+        key = prompt_key(prompt, model)
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, response)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)", (key, response, now))
+                self._db.execute("DELETE FROM llm_responses WHERE created_at <= ?", (now - self.ttl,))
+                self._db.commit()
+
+    def _remember(self, key: str, created_at: float, response: str):
+        self._entries[key] = (created_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,181 @@
+"""Token-budgeted prompt assembly for the ASI1 reasoning rounds in main.py.
+
+The market context (coin data, Fear and Greed index, news and the user's profile) is
+serialised compactly once per analysis and reused by every round; only the previous
+expert reasoning changes between rounds. News and reasoning are trimmed so each
+prompt stays within ASI1_PROMPT_TOKEN_BUDGET (ASI1 accepts at most 28000 tokens).
+"""
+import json
+import os
+import re
+from typing import Optional
+
+ASI1_PROMPT_TOKEN_BUDGET = int(os.getenv("ASI1_PROMPT_TOKEN_BUDGET", 6000))
+ASI1_REASONING_TOKEN_BUDGET = int(os.getenv("ASI1_REASONING_TOKEN_BUDGET", 1500))
+CHARS_PER_TOKEN = 4  # rough average for English text
+NEWS_DESCRIPTION_CHARS = 200
+
+# Angles of the independent experts in the parallel reasoning mode. Distinct prompts also
+# keep the LLM response cache from collapsing the experts into one answer.
+EXPERT_FOCUS = (
+    "market data: price action, 24h change, market cap and trading volume",
+    "sentiment: the Fear and Greed index and the tone of the most recent news",
+    "risk: how well each action fits the user's type of investing and risk strategy",
+    "macro: how worldwide politics and monetary policy in the news affect the cryptomarket",
+)
+
+# Reasoning rounds end with a machine readable verdict, so main.py can stop once they agree
+VERDICT_INSTRUCTIONS = (
+    ' Finish your answer with a last line in exactly this format: "VERDICT: <SELL|BUY|HOLD>; CONFIDENCE: <0.0-1.0>".'
+)
+VERDICT_PATTERN = re.compile(r"VERDICT\W*(SELL|BUY|HOLD)\b(?:\W*CONFIDENCE\W*([01](?:\.\d+)?))?", re.IGNORECASE)
+DECISIONS = ("SELL", "BUY", "HOLD")
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, tokens: int, keep_end: bool = False) -> str:
+    """Cut text to about tokens tokens, keeping its start (or its end, where conclusions usually are)."""
+    limit = max(tokens, 0) * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    return "…" + text[-limit:] if keep_end else text[:limit] + "…"
+
+
+def format_number(value: float) -> str:
+    for threshold, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M")):
+        if abs(value) >= threshold:
+            return f"{value / threshold:.2f}{suffix}"
+    return f"{value:,.2f}"
+
+
+def format_coin(coin) -> str:
+    if coin is None:
+        return "unavailable"
+    return (f"{coin.symbol} ({coin.name}): price ${format_number(coin.current_price)}, "
+            f"24h change {coin.price_change_24h:+.2f}%, market cap ${format_number(coin.market_cap)}, "
+            f"24h volume ${format_number(coin.total_volume)}")
+
+
+def format_fgi(fgi) -> str:
+    if fgi is None or not fgi.data:
+        return "unavailable"
+    return "; ".join(f"{entry.value:g} ({entry.value_classification}) at {entry.timestamp}" for entry in fgi.data)
+
+
+def format_news(news, tokens: int) -> str:
+    """One line per article, dropping descriptions and then the oldest articles until it fits tokens."""
+    try:
+        articles = json.loads(news.cryptoupdates) if news is not None else []
+    except (TypeError, ValueError):
+        articles = []
+    if not articles:
+        return "unavailable"
+
+    lines = [
+        f"- {article.get('title') or ''}: {truncate_to_tokens(article.get('description') or '', NEWS_DESCRIPTION_CHARS // CHARS_PER_TOKEN)}"
+        for article in articles
+    ]
+    if estimate_tokens("\n".join(lines)) > tokens:
+        lines = [f"- {article.get('title') or ''}" for article in articles]
+    while lines and estimate_tokens("\n".join(lines)) > tokens:
+        lines.pop()
+    return "\n".join(lines) or "unavailable"
+
+
+def parse_verdict(reasoning: Optional[str]) -> tuple[Optional[str], float]:
+    """Return (decision, confidence) of a reasoning round.
+
+    Uses the last VERDICT line; when the model left it out, falls back to the only
+    decision word mentioned in the text with a confidence of 0. Returns (None, 0.0)
+    when the answer is ambiguous.
+    """
+    matches = VERDICT_PATTERN.findall(reasoning or "")
+    if matches:
+        decision, confidence = matches[-1]
+        return decision.upper(), min(float(confidence or 0.0), 1.0)
+
+    mentioned = [decision for decision in DECISIONS if re.search(rf"\b{decision}\b", reasoning or "")]
+    return (mentioned[0], 0.0) if len(mentioned) == 1 else (None, 0.0)
+
+
+class PromptBuilder:
+    """Builds the prompts of one analysis session."""
+
+    def __init__(self, network: str, investor: str, risk: str, reason: str,
+                 coin_info=None, fgi_output=None, news_info=None,
+                 token_budget: int = ASI1_PROMPT_TOKEN_BUDGET,
+                 reasoning_budget: int = ASI1_REASONING_TOKEN_BUDGET):
+        self.network = network
+        self.reasoning_budget = reasoning_budget
+
+        context = (
+            f"Consider the following factors:\n"
+            f"Fear Greed Index Analysis - {format_fgi(fgi_output)}\n"
+            f"Coin Market Data - {format_coin(coin_info)}\n"
+            f"Blockchain network - {network}\n"
+            f"User's type of investing - {investor}\n"
+            f"User's risk strategy - {risk}\n"
+            f"User's opinion - {reason}\n"
+        )
+        # news gets whatever the longest round leaves over
+        instructions = max(estimate_tokens(self._final_instructions("", 0)), estimate_tokens(self._refine_instructions("")))
+        news_budget = token_budget - estimate_tokens(context) - instructions - reasoning_budget
+        self.context = context + f"Most recent crypto news:\n{format_news(news_info, news_budget)}\n"
+
+    def initial(self, focus: str = "") -> str:
+        return (
+            f"{self.context}\n"
+            "You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue. "
+            'Given the following information, respond with decision of either "SELL", "BUY" or "HOLD" native token from given network. '
+            "Include your reasoning based on the analysed data and personal thoughts. Consider that the user cannot provide additional information. "
+            "You could point out to questions which could help you making a solid decision."
+            f"{focus}{VERDICT_INSTRUCTIONS}"
+        )
+
+    def refine(self, reasoning: str) -> str:
+        return f"{self.context}\n{self._refine_instructions(self._trim(reasoning))}"
+
+    def final(self, reasoning: str, experts: int) -> str:
+        return f"{self.context}\n{self._final_instructions(self._trim(reasoning), experts)}"
+
+    def expert(self, index: int) -> str:
+        """Independent first-round prompt of expert index, each focusing on a different angle."""
+        focus = EXPERT_FOCUS[index % len(EXPERT_FOCUS)]
+        return self.initial(focus=f" Focus your analysis on {focus}.")
+
+    def aggregate(self, reasonings: list[str]) -> str:
+        """Final prompt over the answers of the parallel experts, sharing the reasoning budget between them."""
+        share = self.reasoning_budget // max(len(reasonings), 1)
+        summary = "\n".join(
+            f"Expert {number}: {truncate_to_tokens(reasoning, share, keep_end=True)}"
+            for number, reasoning in enumerate(reasonings, start=1)
+        ) or "No expert reasoning is available."
+        return f"{self.context}\n{self._final_instructions(summary, len(reasonings))}"
+
+    def _trim(self, reasoning: Optional[str]) -> str:
+        return truncate_to_tokens(reasoning or "", self.reasoning_budget, keep_end=True)
+
+    def _refine_instructions(self, reasoning: str) -> str:
+        return (
+            "You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue.\n"
+            f'This query has been analysed with the following reasoning:\n"{reasoning}"\n'
+            f'Given the following information and reasoning from other expert, respond with decision of either "SELL", "BUY" or "HOLD" native token from {self.network} network. '
+            "Include all of the reasoning based on the analysed data and personal thoughts. Consider that the information provided is the only input from the user, "
+            "and the user cannot provide additional information. However, you could point out to the area or questions which could help you making a solid decision."
+            f"{VERDICT_INSTRUCTIONS}"
+        )
+
+    def _final_instructions(self, reasoning: str, experts: int) -> str:
+        return (
+            "You are an independent expert of a crypto market with knowledge of how worldwide politics affects the cryptomarket. "
+            "You are assisting the user to make the most meaningful decisions, to gain the most revenue whilst minimising potential losses.\n"
+            f'This query has been analysed by {experts} other crypto experts, and here is a summary of their reasoning:\n"{reasoning}"\n'
+            '"SELL" means swapping native crypto coin into USDC.\n'
+            '"BUY" means swapping USDC into native crypto coin.\n'
+            '"HOLD" means no actions.\n'
+            "Given the following information and reasoning from other expert responses, make a decision by responding ONLY with one word "
+            '"SELL", "BUY" or "HOLD" for a native token from given network. Again, your output is either "SELL", "BUY" or "HOLD".'
+        )
@@ -0,0 +1,146 @@
+"""In-process caches shared by the agents."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Async cache with a per-entry TTL and single-flight loading.
+
+    Concurrent lookups of the same missing key share one loader call, so a burst
+    of identical requests costs a single upstream round trip, and
+    get_many_or_load fetches all missing keys of a lookup in one batch. Values
+    are only cached when the loader returns; exceptions propagate to every waiter.
+
+    With max_age set the cache serves stale-while-revalidate: an entry older than
+    its TTL but younger than max_age is returned at once while a background
+    reload refreshes it. Agents keep hot keys warm by calling refresh from an
+    on_interval handler.
+    """
+
+    def __init__(self, ttl: float, key_ttls: Optional[dict] = None, max_age: Optional[float] = None):
+        self.ttl = ttl
+        self.key_ttls = key_ttls or {}  # per-key overrides of ttl
+        self.max_age = max_age  # oldest entry still served while it is reloaded
+        self._entries: dict[Hashable, tuple[float, float, Any]] = {}  # key -> (loaded_at, ttl, value)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _state(self, key: Hashable) -> tuple[Optional[str], Any]:
+        """Return ("fresh" | "stale" | None, value) for key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, None
+        loaded_at, ttl, value = entry
+        age = time.monotonic() - loaded_at
+        if age < ttl:
+            return "fresh", value
+        if self.max_age is not None and age < self.max_age:
+            return "stale", value
+        return None, None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value if it has not expired, without loading it."""
+        state, value = self._state(key)
+        return value if state == "fresh" else None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = self.key_ttls.get(key, self.ttl)
+        self._entries[key] = (time.monotonic(), ttl, value)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for key, calling loader once on a miss."""
+        async def load_one() -> dict:
+            return {key: await loader()}
+
+        results = await self.get_many_or_load([key], lambda _: load_one(), ttl)
+        return results[key]
+
+    async def get_many_or_load(self, keys: list, loader: Callable[[list], Awaitable[dict]],
+                               ttl: Optional[float] = None) -> dict:
+        """Return {key: value} for keys, loading every missing key with one loader(missing) call.
+
+        Keys already being loaded by another caller are awaited instead of reloaded.
+        Keys the loader does not return are left out of the result.
+        """
+        results = {}
+        waiting = set()
+        missing = []
+        stale = []
+        for key in dict.fromkeys(keys):
+            state, value = self._state(key)
+            if state == "fresh":
+                self.hits += 1
+                results[key] = value
+            elif state == "stale":
+                self.stale_hits += 1
+                results[key] = value
+                if key not in self._inflight:
+                    stale.append(key)
+            elif key in self._inflight:
+                self.coalesced += 1
+                waiting.add(self._inflight[key])
+            else:
+                self.misses += 1
+                missing.append(key)
+
+        if stale:
+            self._start_load(stale, loader, ttl)  # revalidate in the background
+
+        if missing:
+            waiting.add(self._start_load(missing, loader, ttl))
+
+        for task in waiting:
+            # shield so a cancelled waiter does not cancel the load shared with the others
+            loaded = await asyncio.shield(task)
+            results.update((key, value) for key, value in loaded.items() if key in keys)
+        return results
+
+    async def refresh(self, keys: list, loader: Callable[[list], Awaitable[dict]], ttl: Optional[float] = None) -> dict:
+        """Reload keys regardless of their age, e.g. from a prefetch interval."""
+        tasks = {self._inflight[key] for key in keys if key in self._inflight}
+        pending = [key for key in keys if key not in self._inflight]
+        if pending:
+            tasks.add(self._start_load(pending, loader, ttl))
+
+        results = {}
+        for task in tasks:
+            results.update(await asyncio.shield(task))
+        return results
+
+    def _start_load(self, keys: list, loader: Callable[[list], Awaitable[dict]], ttl: Optional[float]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(keys, loader, ttl))
+        for key in keys:
+            self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(keys, done))
+        return task
+
+    async def _load(self, keys: list, loader: Callable[[list], Awaitable[dict]], ttl: Optional[float]) -> dict:
+        loaded = await loader(keys)
+        for key, value in loaded.items():
+            self.set(key, value, ttl)
+        return loaded
+
+    def _forget(self, keys: list, task: asyncio.Task):
+        for key in keys:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        # background revalidations have no waiter, so report their failures here
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning(f"⚠️ Cache load of {keys} failed: {task.exception()!r}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.stale_hits + self.coalesced) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -1,12 +1,16 @@
 import os
 import logging
 import sys
-import requests
 import atexit
 import os
 from dotenv import load_dotenv
+from typing import Optional
 from uagents import Agent, Context, Model
 
+import http_client
+from cache import TTLCache
+from http_client import HTTPClientError
+
 # Configure Logging
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -22,6 +26,7 @@ sys.excepthook = handle_unexpected_exception
 
 class CoinRequest(Model):
     blockchain: str
+    session_id: Optional[str] = None
 
 class CoinResponse(Model):
     name: str
@@ -30,6 +35,24 @@ class CoinResponse(Model):
     market_cap: float
     total_volume: float
     price_change_24h: float
+    session_id: Optional[str] = None
+
+class CoinBatchRequest(Model):
+    blockchains: list[str]
+    session_id: Optional[str] = None
+
+class CoinMarketData(Model):
+    blockchain: str
+    name: str
+    symbol: str
+    current_price: float
+    market_cap: float
+    total_volume: float
+    price_change_24h: float
+
+class CoinBatchResponse(Model):
+    coins: list[CoinMarketData]
+    session_id: Optional[str] = None
 
 # Initialize Agent
 agent = Agent(
@@ -39,39 +62,82 @@ agent = Agent(
     endpoint=["http://127.0.0.1:8004/submit"],
     )
 
-def get_crypto_info(blockchain: str) -> CoinResponse:
-    match blockchain:
-        case "ethereum" | "base":  # Both map to "ethereum"
-            coin_id = "ethereum"
-        case "bitcoin":
-            coin_id = "bitcoin"
-        case "matic-network":
-            coin_id = "matic-network"
-        case _:
-            raise ValueError(f"Unsupported blockchain: {blockchain}")  # Handle unexpected inputs
-
-
-    """Fetch cryptocurrency information from CoinGecko API"""
+COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+
+# CoinGecko coin id of the native token of each supported blockchain
+COIN_IDS = {
+    "ethereum": "ethereum",
+    "base": "ethereum",  # Base pays gas in ETH
+    "bitcoin": "bitcoin",
+    "matic-network": "matic-network",
+}
+
+# Market data is cached per coin id; "ethereum" and "base" share one entry
+COIN_CACHE_TTL = float(os.getenv("COIN_CACHE_TTL", 60.0))
+# The watchlist is prefetched every COIN_REFRESH_PERIOD; data up to COIN_MAX_STALENESS old
+# is still served while it is refreshed in the background
+COIN_REFRESH_PERIOD = float(os.getenv("COIN_REFRESH_PERIOD", COIN_CACHE_TTL))
+COIN_MAX_STALENESS = float(os.getenv("COIN_MAX_STALENESS", 300.0))
+COIN_WATCHLIST = os.getenv("COIN_WATCHLIST", "ethereum,bitcoin,matic-network").split(",")
+# Watchlist entries may name a blockchain ("base") or a CoinGecko id; both resolve to coin ids
+WATCHLIST_COIN_IDS = list(dict.fromkeys(
+    COIN_IDS.get(entry.strip().lower(), entry.strip().lower()) for entry in COIN_WATCHLIST if entry.strip()
+))
+COIN_CACHE_TTLS = {
+    "bitcoin": float(os.getenv("BITCOIN_CACHE_TTL", COIN_CACHE_TTL)),
+    "ethereum": float(os.getenv("ETHEREUM_CACHE_TTL", COIN_CACHE_TTL)),
+    "matic-network": float(os.getenv("MATIC_CACHE_TTL", COIN_CACHE_TTL)),
+}
+coin_cache = TTLCache(ttl=COIN_CACHE_TTL, key_ttls=COIN_CACHE_TTLS, max_age=COIN_MAX_STALENESS)
+
+
+def get_coin_id(blockchain: str) -> str:
+    if blockchain not in COIN_IDS:
+        raise ValueError(f"Unsupported blockchain: {blockchain}")  # Handle unexpected inputs
+    return COIN_IDS[blockchain]
+
+
+async def fetch_coins_data(coin_ids: list[str]) -> dict[str, dict]:
+    """Fetch the fields we keep for several coins with one CoinGecko /coins/markets call"""
+    params = {
+        "vs_currency": "usd",
+        "ids": ",".join(coin_ids),
+        "per_page": len(coin_ids),
+    }
+    
+    markets = await http_client.get_json(COINGECKO_MARKETS_URL, params=params)  # Raises HTTPClientError for non-200 responses
+    logging.info(f"🚀 Market data for {', '.join(coin_ids)} received...")
     
-    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
+    return {
+        market['id']: {
+            "name": market['name'],
+            "symbol": market['symbol'].upper(),
+            "current_price": market['current_price'] or 0.0,
+            "market_cap": market['market_cap'] or 0.0,
+            "total_volume": market['total_volume'] or 0.0,
+            "price_change_24h": market['price_change_percentage_24h'] or 0.0,
+        }
+        for market in markets
+    }
+
+
+async def get_coins_info(blockchains: list[str]) -> dict[str, dict]:
+    """Return {coin_id: market data} for the given blockchains, fetching only what coin_cache lacks"""
+    coin_ids = [get_coin_id(blockchain) for blockchain in blockchains]
+    return await coin_cache.get_many_or_load(coin_ids, fetch_coins_data)
+
+
+async def get_crypto_info(blockchain: str) -> CoinResponse:
+    """Fetch cryptocurrency information, served from coin_cache while it is fresh"""
+    coin_id = get_coin_id(blockchain)
     
     try:
-        response = requests.get(url)
-        logging.info("🚀 URL for {coint_id} received...")
-        response.raise_for_status()  # Raises an error for non-200 responses
-
-        data = response.json()
-        
-        return CoinResponse(
-            name=data['name'],
-            symbol=data['symbol'].upper(),
-            current_price=data['market_data']['current_price']['usd'],
-            market_cap=data['market_data']['market_cap']['usd'],
-            total_volume=data['market_data']['total_volume']['usd'],
-            price_change_24h=data['market_data']['price_change_percentage_24h']
-        )
+        coins = await get_coins_info([blockchain])
+        if coin_id not in coins:
+            raise HTTPClientError(f"CoinGecko returned no market data for {coin_id}")
+        return CoinResponse(**coins[coin_id])
     
-    except requests.exceptions.RequestException as e:
+    except HTTPClientError as e:
         logging.error(f"⚠️ API Request Failed: {e}")
         return CoinResponse(
             name="Unknown",
@@ -86,9 +152,11 @@ async def process_response(ctx: Context, msg: CoinRequest) -> CoinResponse:
     """Process the crypto request and return formatted response"""
     logging.debug(f"🔄 Fetching crypto data for: {msg.blockchain}")
 
-    crypto_data = get_crypto_info(msg.blockchain)
+    crypto_data = await get_crypto_info(msg.blockchain)
+    crypto_data.session_id = msg.session_id
     
     ctx.logger.info(f"📊 Crypto Info: {crypto_data}")
+    ctx.logger.debug(f"🗃️ Coin cache: {coin_cache.stats()}")
     return crypto_data
 
 @agent.on_event("startup")
@@ -96,6 +164,20 @@ async def startup(ctx: Context):
     """Initialize agent with a startup message"""
     ctx.logger.info(f"✅ Agent started: {ctx.agent.address}")
 
+@agent.on_interval(period=COIN_REFRESH_PERIOD)
+async def refresh_market_data(ctx: Context):
+    """Keep the market data of the watched coins warm"""
+    try:
+        await coin_cache.refresh(WATCHLIST_COIN_IDS, fetch_coins_data)
+        ctx.logger.debug(f"🗃️ Refreshed {WATCHLIST_COIN_IDS}: {coin_cache.stats()}")
+    except HTTPClientError as e:
+        logging.error(f"⚠️ Market data refresh failed: {e}")
+
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    """Release pooled HTTP connections"""
+    await http_client.close()
+
 @agent.on_message(model=CoinRequest)
 async def handle_message(ctx: Context, sender: str, msg: CoinRequest):
     """Handle incoming messages requesting crypto information"""
@@ -106,6 +188,32 @@ async def handle_message(ctx: Context, sender: str, msg: CoinRequest):
 
     return response
 
+@agent.on_message(model=CoinBatchRequest)
+async def handle_batch_message(ctx: Context, sender: str, msg: CoinBatchRequest):
+    """Handle incoming messages requesting crypto information for several blockchains at once"""
+    ctx.logger.info(f"📩 Received batch message from {sender}: {msg.blockchains}")
+    
+    supported = [blockchain for blockchain in msg.blockchains if blockchain in COIN_IDS]
+    if len(supported) != len(msg.blockchains):
+        logging.error(f"⚠️ Skipping unsupported blockchains: {set(msg.blockchains) - set(supported)}")
+    
+    coins = []
+    try:
+        markets = await get_coins_info(supported)
+        coins = [
+            CoinMarketData(blockchain=blockchain, **markets[COIN_IDS[blockchain]])
+            for blockchain in supported
+            if COIN_IDS[blockchain] in markets
+        ]
+    except HTTPClientError as e:
+        logging.error(f"⚠️ API Request Failed: {e}")
+    
+    ctx.logger.debug(f"🗃️ Coin cache: {coin_cache.stats()}")
+    response = CoinBatchResponse(coins=coins, session_id=msg.session_id)
+    await ctx.send(sender, response)
+
+    return response
+
 if __name__ == "__main__":
     load_dotenv()       # Load environment variables
     agent.run()
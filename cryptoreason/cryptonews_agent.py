@@ -1,22 +1,43 @@
-#pip install newsapi-python
 import os
 from dotenv import load_dotenv
+import asyncio
 import logging
 import sys
 import json
-import requests
+import time
 from typing import Optional
 from uagents import Agent, Context, Model
 import atexit
-from newsapi import NewsApiClient
 
-from datetime import datetime, timedelta
+import http_client
+from news_store import NewsStore
+
+from datetime import datetime, timedelta, timezone
 
 
 
 load_dotenv() 
 # Ensure API key is loaded
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+
+NEWS_QUERY = "crypto OR cryptocurrency OR bitcoin OR ethereum OR recession OR FOMC OR crypto exchange OR bearish OR bullish"#recession, FOMC, crypto exchange, bearish, bullish, financial market
+
+# NewsAPI's free plan allows 100 requests a day, so articles are ingested incrementally into
+# a local store every NEWS_REFRESH_PERIOD; when the last successful poll is older than
+# NEWS_MAX_STALENESS a request still answers from the store and starts an ingest in the background
+NEWS_REFRESH_PERIOD = float(os.getenv("NEWS_REFRESH_PERIOD", 30 * 60.0))
+NEWS_MAX_STALENESS = float(os.getenv("NEWS_MAX_STALENESS", 3 * 60 * 60.0))
+NEWS_DB_PATH = os.getenv("NEWS_DB_PATH", "news.db")
+NEWS_PAGE_SIZE = 100  # NewsAPI maximum
+# Pages fetched per poll to reach the cursor; the free plan serves only the first 100 results
+NEWS_MAX_PAGES = int(os.getenv("NEWS_MAX_PAGES", 5))
+NEWS_RESPONSE_SIZE = 10  # articles sent per CryptonewsRequest
+NEWS_RETENTION = timedelta(days=7)
+news_store = NewsStore(NEWS_DB_PATH)
+news_ingest_lock = asyncio.Lock()
+last_ingest = 0.0
+background_ingest: Optional[asyncio.Task] = None
 
 # Configure Logging
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -40,9 +61,11 @@ class FearGreedData(Model):
 
 class CryptonewsRequest(Model):
     limit: Optional[int] = 1
+    session_id: Optional[str] = None
 
 class CryptonewsResponse(Model):
     cryptoupdates: str
+    session_id: Optional[str] = None
 
 
 # Initialize Agent
@@ -64,42 +87,88 @@ async def startup(ctx: Context):
     #ctx.logger.info(f"{response}")
 
 
-def get_recent_crypto_news(limit: int = 1) -> CryptonewsResponse:
-    """Fetch crypto news data from NewsAPI"""
-    
-    today = datetime.today().strftime('%Y-%m-%d')# Get today's date
-    yesterday = (datetime.today() - timedelta(days=1)).strftime('%Y-%m-%d')# Get yesterday's date by subtracting 1 day
-   
-    crypto_news=""
-    news_output=""
-    extracted_data = []
-    try:
-        newsapi = NewsApiClient(api_key=NEWS_API_KEY)#"NEWS_API_KEY"
-        
-        #already a dictionary
-        crypto_news = newsapi.get_everything(q="crypto OR cryptocurrency OR bitcoin OR ethereum OR recession OR FOMC OR crypto exchange OR bearish OR bullish",from_param=str(yesterday),to=str(today), sort_by = "relevancy", page_size=10, page=1, language="en")#recession, FOMC, crypto exchange, bearish, bullish, financial market
-        
-        logging.info(f"Found info: {crypto_news}")
-        #we need to optimise the size, otherwise it may exceed ASI1 28000 tokens limit
-        #news are delayed by 1 day with free version
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    """Release pooled HTTP connections and the news store"""
+    await http_client.close()
+    news_store.close()
 
-        articles = crypto_news['articles']
-        
-        for article in articles:
-            title = article.get('title')
-            description = article.get('description')
-            content = article.get('content')
-            extracted_data.append({'title': title, 'description': description})#'content':content
+
+async def ingest_crypto_news() -> int:
+    """Poll NewsAPI for articles published since the store's cursor. Returns the number of new articles."""
+    global last_ingest
+    async with news_ingest_lock:
+        now = datetime.now(timezone.utc)
+        # news are delayed by 1 day with free version, so the first poll looks one day back
+        cursor = news_store.cursor() or (now - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
         
+        # Results come newest first, so every page back to the cursor is fetched before anything
+        # is stored: the cursor is the newest stored article, and storing the first page alone
+        # would move it past the articles on the later pages
+        articles = []
+        for page in range(1, NEWS_MAX_PAGES + 1):
+            params = {
+                "q": NEWS_QUERY,
+                "from": cursor,
+                "sortBy": "publishedAt",
+                "pageSize": NEWS_PAGE_SIZE,
+                "page": page,
+                "language": "en",
+            }
+
+            #already a dictionary
+            crypto_news = await http_client.get_json(NEWS_API_URL, headers={"X-Api-Key": NEWS_API_KEY or ""}, params=params)
+            page_articles = crypto_news.get('articles', [])
+            articles += page_articles
+            if len(page_articles) < NEWS_PAGE_SIZE or len(articles) >= crypto_news.get('totalResults', 0):
+                break
+        else:
+            logging.warning(f"⚠️ More than {NEWS_MAX_PAGES} pages of news since {cursor}, older ones are skipped")
         
+        added = news_store.add(articles)
+        news_store.prune((now - NEWS_RETENTION).strftime('%Y-%m-%dT%H:%M:%SZ'))
+        last_ingest = time.monotonic()
+        logging.info(f"📰 Ingested {added} new articles since {cursor}")
+        return added
+
+
+async def run_background_ingest():
+    try:
+        await ingest_crypto_news()
     except Exception as e:
-        logging.error(f"❌ Couldnt connect to NEWS_API: {e}")
+        logging.error(f"❌ Background news ingest failed: {e}")
 
-        
+
+def revalidate_in_background():
+    """Start an ingest unless one is already running"""
+    global background_ingest
+    if background_ingest is None or background_ingest.done():
+        background_ingest = asyncio.create_task(run_background_ingest())
+
+
+async def get_recent_crypto_news(limit: int = 1) -> str:
+    """Return the newest stored crypto news not sent before as a JSON list of title/description pairs"""
+    try:
+        if time.monotonic() - last_ingest > NEWS_MAX_STALENESS:
+            if news_store.cursor() is not None:
+                revalidate_in_background()  # serve the stored articles now
+            else:
+                await ingest_crypto_news()  # nothing to serve yet
+    except Exception as e:
+        logging.error(f"❌ Couldnt connect to NEWS_API, answering from stored news: {e}")
+    
+    #we need to optimise the size, otherwise it may exceed ASI1 28000 tokens limit
+    extracted_data = news_store.unseen(NEWS_RESPONSE_SIZE)
     return json.dumps(extracted_data) #news_output
-            #status="success",
-            #timestamp=datetime.now(timezone.utc).isoformat()
-        
+
+
+@agent.on_interval(period=NEWS_REFRESH_PERIOD)
+async def refresh_news(ctx: Context):
+    """Keep the local news store up to date"""
+    try:
+        await ingest_crypto_news()
+    except Exception as e:
+        logging.error(f"❌ News ingestion failed: {e}")
     
 
 @agent.on_message(model=CryptonewsRequest)
@@ -107,8 +176,8 @@ async def handle_message(ctx: Context, sender: str, msg: CryptonewsRequest):
     """Handle incoming messages requesting crypto news data"""
     logging.info(f"📩 Received message from {sender}: CryptonewsRequest for {msg.limit} entries")
     
-    response = get_recent_crypto_news(msg.limit)
-    await ctx.send(sender, CryptonewsResponse(cryptoupdates=response))
+    response = await get_recent_crypto_news(msg.limit)
+    await ctx.send(sender, CryptonewsResponse(cryptoupdates=response, session_id=msg.session_id))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,18 @@
 import os
 from dotenv import load_dotenv
+import asyncio
 import logging
 import sys
-import requests
+import time
 from datetime import datetime, timezone
 from typing import Optional
 from uagents import Agent, Context, Model
 import atexit
 
+import http_client
+from fgi_store import FGIStore
+from http_client import HTTPClientError
+
 # Configure Logging
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -30,6 +35,7 @@ if not CMC_API_KEY:
 
 class FGIRequest(Model):
     limit: Optional[int] = 1
+    session_id: Optional[str] = None
 
 class FearGreedData(Model):
     value: float
@@ -40,6 +46,21 @@ class FGIResponse(Model):
     data: list[FearGreedData]
     status: str
     timestamp: str
+    session_id: Optional[str] = None
+
+# The index is published daily and kept in a local history store. It is synced from its
+# high-water mark every FGI_REFRESH_PERIOD; when the last successful sync is older than
+# FGI_MAX_STALENESS a request still answers from the store and starts a sync in the background
+FGI_REFRESH_PERIOD = float(os.getenv("FGI_REFRESH_PERIOD", 15 * 60.0))
+FGI_MAX_STALENESS = float(os.getenv("FGI_MAX_STALENESS", 60 * 60.0))
+FGI_DB_PATH = os.getenv("FGI_DB_PATH", "fgi_history.db")
+FGI_SYNC_PAGE_SIZE = 10  # points per CMC call when catching up with the newest data
+FGI_MAX_PAGE_SIZE = 500  # CMC limit per call, also the initial backfill
+FGI_POINT_INTERVAL = 24 * 60 * 60  # one point per day
+fgi_store = FGIStore(FGI_DB_PATH)
+fgi_sync_lock = asyncio.Lock()
+last_sync = 0.0
+background_sync: Optional[asyncio.Task] = None
 
 # Initialize Agent
 agent = Agent(
@@ -58,9 +79,25 @@ async def startup(ctx: Context):
     #dummy_request = FGIRequest(limit=1)
     #await process_response(ctx, dummy_request)
 
+
+@agent.on_interval(period=FGI_REFRESH_PERIOD)
+async def refresh_fear_and_greed_index(ctx: Context):
+    """Keep the local Fear and Greed history up to date"""
+    try:
+        await sync_fear_and_greed_history()
+    except HTTPClientError as e:
+        logging.error(f"⚠️ Fear and Greed sync failed: {e}")
+
+
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    """Release pooled HTTP connections and the history store"""
+    await http_client.close()
+    fgi_store.close()
+
     
-def get_fear_and_greed_index(limit: int = 1) -> FGIResponse:
-    """Fetch Fear and Greed index data from CoinMarketCap API"""
+async def fetch_fear_and_greed_index(limit: int = 1, start: int = 1) -> list[dict]:
+    """Fetch Fear and Greed index data from CoinMarketCap API, newest first from offset start"""
     url = "https://pro-api.coinmarketcap.com/v3/fear-and-greed/historical"
 
     headers = {
@@ -68,46 +105,100 @@ def get_fear_and_greed_index(limit: int = 1) -> FGIResponse:
     }
     
     params = {
+        "start": start,
         "limit": limit
     }
 
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()  # Raises error for non-200 status codes
-        
-        raw_data = response.json()
-        fear_greed_data = []
-
-        for entry in raw_data.get("data", []):
-            data = FearGreedData(
-                value=entry["value"],
-                value_classification=entry["value_classification"],
-                timestamp=entry["timestamp"]
-            )
-            fear_greed_data.append(data)
-
-        #return FGIResponse(
-        #    data=fear_greed_data,
-        #    status="success",
-        #    timestamp=datetime.utcnow(timezone.utc).isoformat()
-        #)
+    raw_data = await http_client.get_json(url, headers=headers, params=params)  # Raises HTTPClientError for non-200 status codes
+    
+    return [
+        {
+            "value": entry["value"],
+            "value_classification": entry["value_classification"],
+            "timestamp": entry["timestamp"],
+        }
+        for entry in raw_data.get("data", [])
+    ]
+
+
+async def sync_fear_and_greed_history() -> int:
+    """Fetch only the points newer than the store's high-water mark. Returns the number added."""
+    global last_sync
+    async with fgi_sync_lock:
+        high_water_mark = fgi_store.high_water_mark()
+        if high_water_mark is None:
+            added = fgi_store.append(await fetch_fear_and_greed_index(FGI_MAX_PAGE_SIZE))
+        else:
+            added = 0
+            start = 1
+            while True:
+                page = await fetch_fear_and_greed_index(FGI_SYNC_PAGE_SIZE, start)
+                added += fgi_store.append(page)
+                # pages are newest first, stop once we reach points we already hold
+                if len(page) < FGI_SYNC_PAGE_SIZE or any(int(entry["timestamp"]) <= high_water_mark for entry in page):
+                    break
+                start += len(page)
         
-        return FGIResponse(
-            data=fear_greed_data,
-            status="success",
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
+        last_sync = time.monotonic()
+        logging.info(f"🗃️ Synced {added} new Fear and Greed points, {fgi_store.count()} stored")
+        return added
+
+
+async def run_background_sync():
+    try:
+        await sync_fear_and_greed_history()
+    except HTTPClientError as e:
+        logging.error(f"⚠️ Background Fear and Greed sync failed: {e}")
+
+
+def revalidate_in_background():
+    """Start a sync unless one is already running"""
+    global background_sync
+    if background_sync is None or background_sync.done():
+        background_sync = asyncio.create_task(run_background_sync())
+
+
+async def extend_fear_and_greed_history(limit: int):
+    """Backfill older points until the store holds at least limit of them"""
+    async with fgi_sync_lock:
+        while (stored := fgi_store.count()) < limit:
+            # CMC pages by days back from its newest point, so the next page starts the day
+            # before our oldest point; counting the stored rows would skip days after a gap
+            oldest, newest = fgi_store.low_water_mark(), fgi_store.high_water_mark()
+            start = 1 if oldest is None else round((newest - oldest) / FGI_POINT_INTERVAL) + 2
+            page = await fetch_fear_and_greed_index(min(limit - stored, FGI_MAX_PAGE_SIZE), start)
+            if not fgi_store.append(page):
+                break  # CMC has no older data
+
+
+async def get_fear_and_greed_index(limit: int = 1) -> FGIResponse:
+    """Return the newest limit Fear and Greed points from the local history store"""
+    limit = max(1, limit or 1)  # a negative LIMIT would return every stored point
+    try:
+        if time.monotonic() - last_sync > FGI_MAX_STALENESS:
+            if fgi_store.count():
+                revalidate_in_background()  # serve the stored points now
+            else:
+                await sync_fear_and_greed_history()  # nothing to serve yet
+        if fgi_store.count() < limit:
+            await extend_fear_and_greed_history(limit)
+    except HTTPClientError as e:
+        logging.error(f"⚠️ API Request Failed, answering from stored history: {e}")
     
-    except requests.exceptions.RequestException as e:
-        logging.error(f"⚠️ API Request Failed: {e}")
-        return FGIResponse(data=[], status="error", timestamp=datetime.utcnow().isoformat())
+    entries = fgi_store.latest(limit)
+    return FGIResponse(
+        data=[FearGreedData(**entry) for entry in entries],
+        status="success" if entries else "error",
+        timestamp=datetime.now(timezone.utc).isoformat()
+    )
 
 
 async def process_response(ctx: Context, msg: FGIRequest) -> FGIResponse:
     """Process the request and return formatted response"""
     logging.debug("🔄 Processing request...")
 
-    fear_greed_data = get_fear_and_greed_index(msg.limit)
+    fear_greed_data = await get_fear_and_greed_index(msg.limit)
+    fear_greed_data.session_id = msg.session_id
     
     for entry in fear_greed_data.data:
         ctx.logger.info(f"📊 Fear and Greed Index: {entry.value}")
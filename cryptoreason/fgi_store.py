@@ -0,0 +1,58 @@
+"""Local append-only history of the CoinMarketCap Fear and Greed index."""
+import sqlite3
+from typing import Optional
+
+
+class FGIStore:
+    """SQLite table of index points keyed by their unix timestamp.
+
+    Points are only ever inserted, so the newest stored timestamp is the high-water
+    mark the agent syncs from, and any window of history is a local range scan.
+    """
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS fear_and_greed (
+                timestamp INTEGER PRIMARY KEY,
+                value REAL NOT NULL,
+                value_classification TEXT NOT NULL
+            )"""
+        )
+        self.conn.commit()
+
+    def high_water_mark(self) -> Optional[int]:
+        """Timestamp of the newest stored point, None while the store is empty."""
+        return self.conn.execute("SELECT MAX(timestamp) FROM fear_and_greed").fetchone()[0]
+
+    def low_water_mark(self) -> Optional[int]:
+        """Timestamp of the oldest stored point, None while the store is empty."""
+        return self.conn.execute("SELECT MIN(timestamp) FROM fear_and_greed").fetchone()[0]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM fear_and_greed").fetchone()[0]
+
+    def append(self, entries: list[dict]) -> int:
+        """Insert points as returned by CMC, ignoring ones already stored. Returns the number added."""
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO fear_and_greed (timestamp, value, value_classification) VALUES (?, ?, ?)",
+            [(int(entry["timestamp"]), float(entry["value"]), entry["value_classification"]) for entry in entries],
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def latest(self, limit: int) -> list[dict]:
+        """The newest limit points, newest first, in the CMC entry format."""
+        rows = self.conn.execute(
+            "SELECT timestamp, value, value_classification FROM fear_and_greed ORDER BY timestamp DESC LIMIT ?",
+            (limit,),
+        )
+        return [
+            {"value": value, "value_classification": classification, "timestamp": str(timestamp)}
+            for timestamp, value, classification in rows
+        ]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,109 @@
+"""Persistent transaction and analysis history of the API wrapper.
+
+Every record goes into an SQLite table in WAL mode. Listing uses keyset pagination
+over the (timestamp, id) order: a page costs an index range scan, however long the
+history grows, and the cursor stays valid while new records are added. The total
+count scans every matching row, so it is only computed when a caller asks for it.
+
+The methods block; the API wrapper calls them through asyncio.to_thread.
+"""
+import base64
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(timestamp: float, row_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{timestamp!r}:{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """Raises ValueError for a malformed cursor."""
+    timestamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+    return float(timestamp), int(row_id)
+
+
+class HistoryStore:
+    """SQLite table of transactions, newest first, indexed by timestamp and action."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS transactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp REAL NOT NULL,
+                action TEXT,
+                status TEXT,
+                record TEXT NOT NULL
+            )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS transactions_timestamp ON transactions (timestamp, id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS transactions_action ON transactions (action, timestamp, id)")
+        self.conn.commit()
+
+    def add(self, record: dict, action: Optional[str] = None) -> int:
+        """Store a transaction as returned to the frontend. Returns its id."""
+        record = {"timestamp": time.time(), **record}
+        action = (action or record.get("action") or "").upper() or None
+        with self._lock:
+            row_id = self.conn.execute(
+                "INSERT INTO transactions (timestamp, action, status, record) VALUES (?, ?, ?, ?)",
+                (float(record["timestamp"]), action, record.get("status"), json.dumps(record)),
+            ).lastrowid
+            self.conn.commit()
+        return row_id
+
+    def page(self, limit: int = 50, cursor: Optional[str] = None, since: Optional[float] = None,
+             until: Optional[float] = None, action: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        """Return up to limit records older than cursor, newest first, and the cursor of the next page."""
+        where, params = self._filters(since, until, action)
+        if cursor:
+            timestamp, row_id = decode_cursor(cursor)
+            where.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params += [timestamp, timestamp, row_id]
+
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT id, timestamp, record FROM transactions {self._where(where)} "
+                "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                params + [limit + 1],
+            ).fetchall()
+
+        items = [{"id": row_id, **json.loads(record)} for row_id, _, record in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1][1], rows[limit - 1][0]) if len(rows) > limit else None
+        return items, next_cursor
+
+    def count(self, since: Optional[float] = None, until: Optional[float] = None, action: Optional[str] = None) -> int:
+        """Number of records matching the filters; a full scan of them, so opt-in for callers."""
+        where, params = self._filters(since, until, action)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM transactions {self._where(where)}", params).fetchone()[0]
+
+    @staticmethod
+    def _filters(since: Optional[float], until: Optional[float], action: Optional[str]) -> tuple[list, list]:
+        where, params = [], []
+        if action:
+            where.append("action = ?")
+            params.append(action.upper())
+        if since is not None:
+            where.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("timestamp < ?")
+            params.append(until)
+        return where, params
+
+    @staticmethod
+    def _where(where: list) -> str:
+        return f"WHERE {' AND '.join(where)}" if where else ""
+
+    def close(self):
+        self.conn.close()
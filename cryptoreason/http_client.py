@@ -0,0 +1,148 @@
+"""Shared non-blocking HTTP client used by the data agents.
+
+All agents go through one pooled aiohttp session per process, so upstream calls
+(CoinGecko, CoinMarketCap, NewsAPI, ASI1) reuse keep-alive connections, never block
+the uAgents event loop and always run with a timeout.
+
+Settings can be overridden through environment variables:
+    HTTP_TIMEOUT          total seconds allowed for a request (default 10)
+    HTTP_CONNECT_TIMEOUT  seconds allowed to open a connection (default 5)
+    HTTP_MAX_CONNECTIONS  size of the keep-alive connection pool (default 20)
+    HTTP_MAX_CONCURRENCY  requests allowed in flight at once (default 10)
+    HTTP_KEEPALIVE        seconds an idle connection is kept open (default 30)
+
+The Flask based swapland agents have no event loop of their own; they go through
+run_sync, which runs the coroutines on a background loop shared by the process.
+"""
+import asyncio
+import json as jsonlib
+import logging
+import os
+import threading
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10.0))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5.0))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 20))
+HTTP_MAX_CONCURRENCY = int(os.getenv("HTTP_MAX_CONCURRENCY", 10))
+HTTP_KEEPALIVE = float(os.getenv("HTTP_KEEPALIVE", 30.0))
+
+
+class HTTPClientError(Exception):
+    """Raised when a request fails, times out or returns a non-2xx status."""
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_session() -> tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+    """Create the pooled session lazily, inside the running event loop."""
+    global _session, _semaphore
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=HTTP_MAX_CONNECTIONS, keepalive_timeout=HTTP_KEEPALIVE)
+        timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _semaphore = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+    return _session, _semaphore
+
+
+async def request_json(method: str, url: str, *, headers: Optional[dict] = None, params: Optional[dict] = None,
+                       json: Optional[dict] = None, timeout: Optional[float] = None):
+    """Send a request and return the decoded JSON body.
+
+    Parameters:
+        method (str): HTTP method, e.g. "GET" or "POST".
+        url (str): Endpoint to call.
+        headers, params, json: Passed through to aiohttp.
+        timeout (float): Overrides HTTP_TIMEOUT for slow endpoints such as the LLM.
+
+    Raises:
+        HTTPClientError: On connection errors, timeouts, non-2xx responses and non-JSON bodies.
+    """
+    session, semaphore = _get_session()
+    extra = {"timeout": aiohttp.ClientTimeout(total=timeout, connect=HTTP_CONNECT_TIMEOUT)} if timeout else {}
+
+    try:
+        async with semaphore:
+            async with session.request(method, url, headers=headers, params=params, json=json, **extra) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.error(f"⚠️ {method} {url} failed: {e!r}")
+        raise HTTPClientError(f"{method} {url} failed: {e!r}") from e
+    except ValueError as e:
+        logging.error(f"⚠️ {method} {url} returned a non-JSON body: {e!r}")
+        raise HTTPClientError(f"{method} {url} returned a non-JSON body: {e!r}") from e
+
+
+async def get_json(url: str, **kwargs):
+    """GET a JSON document, see request_json."""
+    return await request_json("GET", url, **kwargs)
+
+
+async def post_json(url: str, **kwargs):
+    """POST and return the JSON reply, see request_json."""
+    return await request_json("POST", url, **kwargs)
+
+
+async def stream_events(method: str, url: str, *, headers: Optional[dict] = None, json: Optional[dict] = None,
+                        timeout: Optional[float] = None) -> AsyncIterator[dict]:
+    """Send a request answered with server-sent events and yield each decoded JSON event.
+
+    Iteration ends at the "[DONE]" sentinel. Closing the generator early (e.g. with
+    contextlib.aclosing once the caller has what it needs) releases the connection,
+    which aborts the rest of the upstream generation.
+
+    Raises:
+        HTTPClientError: On connection errors, timeouts and non-2xx responses.
+    """
+    session, semaphore = _get_session()
+    extra = {"timeout": aiohttp.ClientTimeout(total=timeout, connect=HTTP_CONNECT_TIMEOUT)} if timeout else {}
+
+    try:
+        async with semaphore:
+            async with session.request(method, url, headers=headers, json=json, **extra) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    line = line.decode("utf-8", errors="replace").strip()
+                    if not line.startswith("data:"):
+                        continue  # blank separators, comments and other SSE fields
+                    payload = line[len("data:"):].strip()
+                    if payload == "[DONE]":
+                        return
+                    try:
+                        yield jsonlib.loads(payload)
+                    except ValueError:
+                        logging.warning(f"⚠️ Skipping malformed event from {url}: {payload[:100]}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logging.error(f"⚠️ {method} {url} stream failed: {e!r}")
+        raise HTTPClientError(f"{method} {url} stream failed: {e!r}") from e
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def run_sync(coro):
+    """Run a coroutine of this module from synchronous code and return its result.
+
+    The background loop is started on first use and lives as long as the process, so
+    the pooled session it holds keeps its connections between calls.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="http-client", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+async def close():
+    """Close the pooled session, called from the agents' shutdown handlers."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,97 @@
+"""In-memory registry of the trading analyses submitted through the API wrapper.
+
+A job is created when /api/submit-inputs accepts a request and is then advanced by a
+coroutine on the wrapper's event loop. Every change is appended to the job's event
+list, so GET /api/jobs/<id> returns the latest state and the SSE stream replays the
+events a client has not seen yet. Finished jobs are dropped after JOB_TTL seconds.
+
+Jobs live in the memory of the server process, which is why the API wrapper runs a
+single worker.
+"""
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+JOB_TTL = float(os.getenv("JOB_TTL", 60 * 60.0))
+
+# queued -> running -> success | error
+FINISHED = ("success", "error")
+
+
+@dataclass
+class Job:
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"
+    message: str = "Request accepted"
+    result: Optional[dict] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    events: list = field(default_factory=list)
+    waiters: set = field(default_factory=set, repr=False)  # futures of the streams waiting for an event
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "message": self.message,
+            "data": self.result,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobStore:
+    """Job registry used from a single asyncio event loop."""
+
+    def __init__(self, ttl: float = JOB_TTL):
+        self.ttl = ttl
+        self._jobs: dict[str, Job] = {}
+
+    def create(self) -> Job:
+        job = Job()
+        self._prune()
+        self._jobs[job.job_id] = job
+        self._record(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def update(self, job: Job, status: str, message: str, result: Optional[dict] = None):
+        """Move a job to a new state and wake up the streams waiting on it."""
+        job.status = status
+        job.message = message
+        if result is not None:
+            job.result = result
+        job.updated_at = time.time()
+        self._record(job)
+        for waiter in job.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        job.waiters.clear()
+
+    async def wait_for_events(self, job: Job, seen: int, timeout: float) -> list:
+        """Wait until the job has more than seen events or timeout passes, return the new ones."""
+        if len(job.events) <= seen:
+            waiter = asyncio.get_running_loop().create_future()
+            job.waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                job.waiters.discard(waiter)
+        return job.events[seen:]
+
+    def _record(self, job: Job):
+        job.events.append({"seq": len(job.events), **job.to_dict()})
+
+    def _prune(self):
+        now = time.time()
+        for job_id in [jid for jid, job in self._jobs.items() if job.finished and now - job.updated_at > self.ttl]:
+            del self._jobs[job_id]
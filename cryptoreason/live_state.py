@@ -0,0 +1,86 @@
+"""Versioned live state pushed to the dashboard over /api/stream.
+
+The state is a set of named sections (agent status, market data, FGI, news). Every
+change of a section bumps the version and is kept in a bounded delta log, so a
+client that reconnects with the last version it saw receives only the deltas it
+missed, or a full snapshot when that version has already left the log. Sections
+are compared by value, so republishing unchanged data sends nothing.
+
+Versions restart with the server, so each process picks a random epoch and event ids
+are "<epoch>:<version>". An id from another epoch (or an unreadable one) gets a fresh
+snapshot instead of deltas computed against the wrong version.
+"""
+import asyncio
+import json
+import uuid
+from collections import deque
+from typing import Any, Optional
+
+LIVE_DELTA_LOG = 1000
+
+
+class LiveState:
+    """Sections of the dashboard state with a version counter, used from one event loop."""
+
+    def __init__(self, log_size: int = LIVE_DELTA_LOG):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+        self._sections: dict[str, Any] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._deltas: deque = deque(maxlen=log_size)  # {"version", "section", "data"}
+        self._waiters: set = set()
+
+    def publish(self, section: str, data: Any) -> bool:
+        """Set a section, recording a delta if its value changed. Returns whether it changed."""
+        fingerprint = json.dumps(data, sort_keys=True, default=str)
+        if self._fingerprints.get(section) == fingerprint:
+            return False
+
+        self.version += 1
+        self._sections[section] = data
+        self._fingerprints[section] = fingerprint
+        self._deltas.append({"version": self.version, "section": section, "data": data})
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+        return True
+
+    def event_id(self, version: int) -> str:
+        return f"{self.epoch}:{version}"
+
+    def parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        """The version of an event id from this epoch, or None if the client needs a snapshot."""
+        epoch, _, version = (event_id or "").partition(":")
+        if epoch != self.epoch:
+            return None
+        try:
+            return int(version)
+        except ValueError:
+            return None
+
+    def snapshot(self) -> dict:
+        return {"epoch": self.epoch, "version": self.version, "data": dict(self._sections)}
+
+    def deltas_since(self, version: int) -> Optional[list]:
+        """Deltas newer than version, or None if some of them are no longer in the log."""
+        if version > self.version:
+            return None
+        if version == self.version:
+            return []
+        if not self._deltas or self._deltas[0]["version"] > version + 1:
+            return None
+        return [delta for delta in self._deltas if delta["version"] > version]
+
+    async def wait_for_change(self, version: int, timeout: float) -> bool:
+        """Wait until the state moves past version or timeout passes. Returns whether it did."""
+        if self.version > version:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._waiters.discard(waiter)
+            return False
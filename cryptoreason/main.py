@@ -25,6 +25,11 @@ from cosmpy.aerial.wallet import LocalWallet
 
 import asyncio
 import json
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from asi.prompt_builder import EXPERT_FOCUS, PromptBuilder, estimate_tokens, parse_verdict
 # Remove these imports as they're not needed
 # from flask import jsonify, request
 
@@ -70,18 +75,26 @@ class Heartbeat(Model):
 
 class CoinRequest(Model):
     blockchain: str
+    session_id: Optional[str] = None
 
 class CryptonewsRequest(Model):
     limit: Optional[int] = 1
+    session_id: Optional[str] = None
 
 class CryptonewsResponse(Model):
     cryptoupdates: str
+    session_id: Optional[str] = None
     
 class ASI1Request(Model):
     query: str
+    session_id: Optional[str] = None
+    expert: Optional[int] = None  # index of the expert in the parallel reasoning mode
+    kind: Optional[str] = None  # "reasoning", "expert" or "decision", sets the output length cap
     
 class ASI1Response(Model):
     decision: str
+    session_id: Optional[str] = None
+    expert: Optional[int] = None
 
 class CoinResponse(Model):
     name: str
@@ -90,9 +103,11 @@ class CoinResponse(Model):
     market_cap: float
     total_volume: float
     price_change_24h: float
+    session_id: Optional[str] = None
 
 class FGIRequest(Model):
     limit: Optional[int] = 1
+    session_id: Optional[str] = None
 
 class FearGreedData(Model):
     value: float
@@ -103,6 +118,7 @@ class FGIResponse(Model):
     data: list[FearGreedData]
     status: str
     timestamp: str
+    session_id: Optional[str] = None
 
 
 ### REWARD AGENT ###
@@ -149,15 +165,106 @@ ONETESTFET = 1000000000000000000
 REWARD = 2000000000000000000 #expected to receive
 DENOM = "atestfet"
 
-NETWORK = "base" #default global
-COININFORMATION = ""
-CRYPTONEWSINFO = ""
+SUPPORTED_NETWORKS = ("base", "ethereum", "matic-network", "bitcoin")
+SUPPORTED_INVESTORS = ("long-term", "short-term", "speculate")
+SUPPORTED_RISKS = ("conservative", "balanced", "aggressive", "speculative")
+
+ASIITERATIONS = 4 #number of ASI1 reasoning rounds per analysis
+
+# "serial" chains ASIITERATIONS rounds, each refining the previous answer. "parallel" asks
+# ASI_EXPERT_COUNT independent experts at once and aggregates their answers in one more
+# round, waiting at most ASI_EXPERT_DEADLINE seconds for the experts. There is one expert
+# per EXPERT_FOCUS at most, more would only repeat the same prompt
+ASI_REASONING_MODE = os.getenv("ASI_REASONING_MODE", "serial")
+ASI_EXPERT_COUNT = min(max(int(os.getenv("ASI_EXPERT_COUNT", ASIITERATIONS - 1)), 1), len(EXPERT_FOCUS))
+ASI_EXPERT_DEADLINE = float(os.getenv("ASI_EXPERT_DEADLINE", 90.0))
+# Stop reasoning early once the last ASI_AGREEMENT_ROUNDS verdicts name the same action,
+# each with at least ASI_AGREEMENT_CONFIDENCE. 0 always runs every round
+ASI_AGREEMENT_ROUNDS = int(os.getenv("ASI_AGREEMENT_ROUNDS", 2))
+ASI_AGREEMENT_CONFIDENCE = float(os.getenv("ASI_AGREEMENT_CONFIDENCE", 0.7))
+LLM_CALLS_SAVED = 0 #ASI1 calls skipped by early stopping since startup
+SESSION_TTL = 60 * 60.0 #analyses older than this are dropped
+
+# Seconds to wait for each data agent before reasoning starts with partial data
+SOURCE_DEADLINES = {
+    "coin": float(os.getenv("COIN_SOURCE_DEADLINE", 10.0)),
+    "news": float(os.getenv("NEWS_SOURCE_DEADLINE", 15.0)),
+    "fgi": float(os.getenv("FGI_SOURCE_DEADLINE", 10.0)),
+}
+
 
-ASIITERATIONS = 4
-RISK = " "
-INVESTOR = " "
-FGIOUTPUT = " "
-USERREASON = ""
+@dataclass
+class AnalysisSession:
+    """State of one coin -> news -> FGI -> ASI1 analysis, keyed by session_id."""
+    network: str = "base"
+    investor: str = " "
+    risk: str = " "
+    reason: str = ""
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created_at: float = field(default_factory=time.time)
+    coin_info: Optional[CoinResponse] = None
+    news_info: Optional[CryptonewsResponse] = None
+    fgi_output: Optional[FGIResponse] = None
+    iterations: int = ASIITERATIONS
+    requested_at: float = 0.0
+    pending_sources: set = field(default_factory=set)
+    reasoning_started: bool = False
+    prompts: Optional[PromptBuilder] = None
+    experts_sent_at: float = 0.0
+    expert_replies: dict = field(default_factory=dict)
+    aggregating: bool = False
+    verdicts: list = field(default_factory=list) #(decision, confidence) of each reasoning round
+    calls_saved: int = 0
+
+
+# In-flight analyses, so several requests can run through the pipeline concurrently
+SESSIONS: dict[str, AnalysisSession] = {}
+
+
+def start_session(network: str, investor: str, risk: str, reason: str) -> AnalysisSession:
+    """Register a new analysis session, dropping the ones which outlived SESSION_TTL."""
+    now = time.time()
+    for session_id in [sid for sid, s in SESSIONS.items() if now - s.created_at > SESSION_TTL]:
+        logging.warning(f"⌛ Dropping expired analysis session {session_id}")
+        SESSIONS.pop(session_id, None)
+
+    session = AnalysisSession(network=network, investor=investor, risk=risk, reason=reason)
+    SESSIONS[session.session_id] = session
+    return session
+
+
+def get_session(session_id: Optional[str]) -> Optional[AnalysisSession]:
+    """Look up the session a reply belongs to."""
+    session = SESSIONS.get(session_id) if session_id else None
+    if session is None:
+        logging.warning(f"⚠️ Received reply for unknown analysis session: {session_id}")
+    return session
+
+
+def end_session(session: AnalysisSession):
+    SESSIONS.pop(session.session_id, None)
+
+
+def agreed_verdict(verdicts: list, every_reply: bool = False) -> Optional[str]:
+    """The action the last ASI_AGREEMENT_ROUNDS verdicts agree on confidently enough, or None.
+
+    With every_reply (parallel experts) all verdicts received so far have to agree, each
+    with at least ASI_AGREEMENT_CONFIDENCE, and there have to be ASI_AGREEMENT_ROUNDS of them.
+    """
+    if ASI_AGREEMENT_ROUNDS < 1 or len(verdicts) < ASI_AGREEMENT_ROUNDS:
+        return None
+    considered = verdicts if every_reply else verdicts[-ASI_AGREEMENT_ROUNDS:]
+    decisions = {decision for decision, _ in considered}
+    if len(decisions) == 1 and None not in decisions and min(confidence for _, confidence in considered) >= ASI_AGREEMENT_CONFIDENCE:
+        return decisions.pop()
+    return None
+
+
+def record_early_stop(session: AnalysisSession, calls_saved: int):
+    global LLM_CALLS_SAVED
+    session.calls_saved = calls_saved
+    LLM_CALLS_SAVED += calls_saved
+    logging.info(f"⏩ Reasoning of session {session.session_id} converged early, saved {calls_saved} ASI1 calls ({LLM_CALLS_SAVED} since startup)")
 
 # Global variable to store analysis results
 LATEST_ANALYSIS = {
@@ -226,26 +333,27 @@ async def handle_trading_request(ctx: Context, sender: str, msg: TradingRequest)
     ctx.logger.info(f"Received trading request from {sender}: {msg.request_id}")
     
     # Extract the trading parameters
-    global NETWORK, RISK, INVESTOR, USERREASON
-    NETWORK = msg.network
-    INVESTOR = msg.investor_type
-    RISK = msg.risk_strategy
-    USERREASON = msg.reason
+    network = msg.network
+    investor = msg.investor_type
+    risk = msg.risk_strategy
+    reason = msg.reason
     
     # In a real implementation, you'd trigger the full analysis flow here
     # by communicating with all the needed agents (coin_info, fgi, news, llm, etc.)
     # For now, we'll provide a simulated response based on simple rules
     
     # Simplified logic - in real use, this would be based on comprehensive analysis
-    action = "BUY" if NETWORK == "ethereum" else "SELL"
-    action = "HOLD" if "hold" in USERREASON.lower() else action
+    action = "BUY" if network == "ethereum" else "SELL"
+    action = "HOLD" if "hold" in reason.lower() else action
     
     # If the user explicitly mentions an action in their reason, use that
-    if "buy" in USERREASON.lower():
+    if "buy" in reason.lower():
         action = "BUY"
-    elif "sell" in USERREASON.lower():
+    elif "sell" in reason.lower():
         action = "SELL"
     
+    details = f"Analysis complete based on {risk} strategy for {investor} investor on {network}."
+    
     # Send the analysis result back to the API agent
     await ctx.send(
         sender,
@@ -253,7 +361,7 @@ async def handle_trading_request(ctx: Context, sender: str, msg: TradingRequest)
             action=action,
             amount=0.5,
             price=2000.00,
-            details=f"Analysis complete based on {RISK} strategy for {INVESTOR} investor on {NETWORK}.",
+            details=details,
             timestamp=msg.timestamp,
             request_id=msg.request_id
         )
@@ -265,7 +373,7 @@ async def handle_trading_request(ctx: Context, sender: str, msg: TradingRequest)
         "action": action,
         "amount": 0.5,
         "price": 2000.00,
-        "details": f"Analysis complete based on {RISK} strategy for {INVESTOR} investor on {NETWORK}.",
+        "details": details,
         "timestamp": msg.timestamp
     }
 
@@ -362,22 +470,22 @@ async def message_handler(ctx: Context, sender: str, msg: PaymentReceived):
         #startup asi1 routine
         """Requests market data for the monitored coin once a day."""
         try:
-            # Confirm chain
-            global NETWORK
-            #print(f"Please, confirm the chain to request the data from")
-            
             #need to add userinput
-            NETWORK = "base"#input("Blockchain [ethereum/base/bitcoin/matic-network]? ").lower()
+            network = "base"#input("Blockchain [ethereum/base/bitcoin/matic-network]? ").lower()
+            investor = "speculate" #input("Investor [long-term/short-term/speculate]: ").lower()
+            risk = "speculative" #input("Risk strategy [conservative/balanced/aggressive/speculative]: ").lower()
+            reason = "I would like to sell Ether no matter what. sell sell sell!. I order you to sell!" #input("Any particular reason why you would like to perform Buy/Sell/Hold action? ").lower()
             
+            if (network not in SUPPORTED_NETWORKS) or (investor not in SUPPORTED_INVESTORS) or (risk not in SUPPORTED_RISKS):
+                logging.error(f"Aborted: unsupported analysis inputs {network}/{investor}/{risk}")
+                return
             
-            if ((NETWORK != "base") and (NETWORK != "ethereum") and (NETWORK != "matic-network") and (NETWORK != "bitcoin")):
-                print("Aborted")
-                sys.exit(1)
+            session = start_session(network, investor, risk, reason)
+            ctx.logger.info(f"Starting analysis session {session.session_id}")
             
             await asyncio.sleep(5)
             
-            await ctx.send(COIN_AGENT, CoinRequest(blockchain=NETWORK))
-            print(f"Sent request") #stuck here
+            await request_market_data(ctx, session)
 
         except Exception as e:
             logging.error(f"Failed to send request: {e}")
@@ -386,183 +494,258 @@ async def message_handler(ctx: Context, sender: str, msg: PaymentReceived):
         ctx.logger.info(f"Fees transaction unsuccessful!")
         
 
+async def request_market_data(ctx: Context, session: AnalysisSession):
+    """Scatter the coin, news and FGI requests of a session to the data agents at once."""
+    session.requested_at = time.time()
+    session.pending_sources = set(SOURCE_DEADLINES)
+    
+    requests_to_send = {
+        "coin": (COIN_AGENT, CoinRequest(blockchain=session.network, session_id=session.session_id)),
+        "news": (CRYPTONEWS_AGENT, CryptonewsRequest(session_id=session.session_id)),
+        "fgi": (FGI_AGENT, FGIRequest(session_id=session.session_id)),
+    }
+    results = await asyncio.gather(
+        *(ctx.send(destination, message) for destination, message in requests_to_send.values()),
+        return_exceptions=True,
+    )
+    for source, result in zip(requests_to_send, results):
+        if isinstance(result, Exception):
+            logging.error(f"❌ Error sending {source} request for session {session.session_id}: {result}")
+            session.pending_sources.discard(source)
+    logging.info(f"📩 Sent market data requests for session {session.session_id}")
+    
+    if not session.pending_sources:
+        await start_reasoning(ctx, session)
+
+
+async def gather_market_data(ctx: Context, session_id: Optional[str], source: str, data: Model):
+    """Store the reply of one data agent and start reasoning once all of them replied."""
+    session = get_session(session_id)
+    if session is None:
+        return
+    
+    if session.reasoning_started:
+        logging.warning(f"⌛ Late {source} reply for session {session.session_id} ignored")
+        return
+    
+    setattr(session, {"coin": "coin_info", "news": "news_info", "fgi": "fgi_output"}[source], data)
+    session.pending_sources.discard(source)
+    
+    if not session.pending_sources:
+        await start_reasoning(ctx, session)
+
+
+@agent.on_interval(period=1.0)
+async def enforce_source_deadlines(ctx: Context):
+    """Start reasoning with partial data for sessions whose data agents missed their deadline."""
+    now = time.time()
+    for session in list(SESSIONS.values()):
+        if session.reasoning_started or not session.pending_sources:
+            continue
+        
+        overdue = [source for source in session.pending_sources if now - session.requested_at > SOURCE_DEADLINES[source]]
+        if overdue:
+            logging.warning(f"⌛ No {', '.join(overdue)} data for session {session.session_id} in time")
+            session.pending_sources.difference_update(overdue)
+        
+        if not session.pending_sources:
+            await start_reasoning(ctx, session)
+
+
 @agent.on_message(model=CoinResponse)
 async def handle_coin_response(ctx: Context, sender: str, msg: CoinResponse):
-    """Handles coin market data and requests Cryptonews."""
+    """Handles coin market data."""
     logging.info(f"📩 Received CoinResponse: {msg}")
-    
-    global COININFORMATION
-    
-    COININFORMATION = msg
-    try:
-        #temporary disabled cryptonews
-        #await ctx.send(FGI_AGENT, FGIRequest()) #temporary call
-        await ctx.send(CRYPTONEWS_AGENT, CryptonewsRequest()) #need to sent the data from this coin, change within 24 hours!
-    except Exception as e:
-        logging.error(f"❌ Error sending CryptonewsRequest: {e}")
+    await gather_market_data(ctx, msg.session_id, "coin", msg)
 
 
-#temporary disabled
 @agent.on_message(model=CryptonewsResponse)
 async def handle_cryptonews_response(ctx: Context, sender: str, msg: CryptonewsResponse):
-    """Handles cryptonews market data and requests FGI"""
+    """Handles cryptonews market data."""
     logging.info(f"📩 Received CryptonewsResponse!")
-    
-    global CRYPTONEWSINFO
-    CRYPTONEWSINFO = msg
-    
-    logging.info(f"📩 Sending request to FGI!")
-    try:
-        await ctx.send(FGI_AGENT, FGIRequest())
-        logging.info(f"📩 Request to FGI sent!")
-    except Exception as e:
-        logging.error(f"❌ Error sending FGIRequest: {e}")
+    await gather_market_data(ctx, msg.session_id, "news", msg)
 
 
 @agent.on_message(model=FGIResponse)
 async def handle_fgi_response(ctx: Context, sender: str, msg: FGIResponse):
-    """Analyzes FGI data and determines whether to issue a SELL/BUY or HOLD alert."""
+    """Handles FGI data."""
     logging.info(f"📊 Received FGIResponse: {msg}")
-    global INVESTOR
-    global RISK
-    global USERREASON
-    global FGIOUTPUT
-    
-    FGIOUTPUT = msg
-    
-    print(f"Please, confirm if you long-term or short-term investor?")
-    
-    #need to add userinput
-    INVESTOR = "speculate" #input("Investor [long-term/short-term/speculate]: ").lower()
-    
-    if ((INVESTOR != "long-term") and (INVESTOR != "short-term") and (INVESTOR != "speculate")):
-        print("Aborted")
-        sys.exit(1)
-        
-    print(f"Please, confirm your risk strategy for investments?")
-    #need to add userinput
-    RISK = "speculative" #input("Risk strategy [conservative/balanced/aggressive/speculative]: ").lower()
-    if ((RISK != "conservative") and (RISK != "balanced")and (RISK != "aggressive")and (RISK != "speculative")):
-        print("Aborted")
-        sys.exit(1)
-       
-    #userinput to be added
-    USERREASON = "I would like to sell Ether no matter what. sell sell sell!. I order you to sell!" #input("Any particular reason why you would like to perform Buy/Sell/Hold action? ").lower()
+    await gather_market_data(ctx, msg.session_id, "fgi", msg)
+
+
+async def start_reasoning(ctx: Context, session: AnalysisSession):
+    """Analyzes the gathered data and determines whether to issue a SELL/BUY or HOLD alert."""
+    session.reasoning_started = True
+    logging.info(f"🧠 Gathered market data for session {session.session_id} in {time.time() - session.requested_at:.2f}s")
             
-    # Most recent crypto news -{CRYPTONEWSINFO}
-    # Construct the AI prompt
-    prompt = f'''    
-    Consider the following factors:
-    
-    Fear Greed Index Analysis - {FGIOUTPUT}
-    Coin Market Data - {COININFORMATION}
-    Blockchain network - {NETWORK}
-    User's type of investing - {INVESTOR}
-    User's risk strategy - {RISK}
-    Most recent crypto news - {CRYPTONEWSINFO}
-    
-    User's opinion - {USERREASON}
+    # Serialise the gathered data once, every reasoning round reuses it
+    session.prompts = PromptBuilder(
+        network=session.network,
+        investor=session.investor,
+        risk=session.risk,
+        reason=session.reason,
+        coin_info=session.coin_info,
+        fgi_output=session.fgi_output,
+        news_info=session.news_info,
+    )
+    if ASI_REASONING_MODE == "parallel":
+        await ask_experts(ctx, session)
+        return
     
-    You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue. 
-    Given the following information, respond with decision of either "SELL", "BUY" or "HOLD" native token from given network. Inlcude your reasoning based on the analysed data and personal thoughts. Consider that the user cannot provide additional information. You could point out to questions which could help you making a solid decision.
-    '''
+    prompt = session.prompts.initial()
+    logging.info(f"📝 ASI1 prompt for session {session.session_id}: ~{estimate_tokens(prompt)} tokens")
     
     try:
-        #response = query_llm(prompt)  # Query ASI1 Mini for a decision
         #compined prompt sent to ASI1 agent
-        await ctx.send(REASON_AGENT, ASI1Request(query=prompt))
+        await ctx.send(REASON_AGENT, ASI1Request(query=prompt, session_id=session.session_id, kind="reasoning"))
         #moved to Asi1Response
     except Exception as e:
         logging.error(f"❌ Error querying ASI1 model: {e}")
 
 
+async def ask_experts(ctx: Context, session: AnalysisSession):
+    """Send ASI_EXPERT_COUNT independent expert prompts at once."""
+    session.experts_sent_at = time.time()
+    prompts = [session.prompts.expert(index) for index in range(ASI_EXPERT_COUNT)]
+    logging.info(f"📝 Asking {ASI_EXPERT_COUNT} ASI1 experts for session {session.session_id}: ~{estimate_tokens(prompts[0])} tokens each")
+    
+    results = await asyncio.gather(
+        *(ctx.send(REASON_AGENT, ASI1Request(query=prompt, session_id=session.session_id, expert=index, kind="expert"))
+          for index, prompt in enumerate(prompts)),
+        return_exceptions=True,
+    )
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            logging.error(f"❌ Error querying ASI1 expert {index}: {result}")
+            session.expert_replies[index] = None
+    
+    if len(session.expert_replies) == ASI_EXPERT_COUNT:
+        await aggregate_experts(ctx, session)
+
+
+async def aggregate_experts(ctx: Context, session: AnalysisSession):
+    """Run the single aggregation round over the expert answers received so far, unless they all agree.
+
+    Without any answer (every expert failed or missed the deadline) the session ends on HOLD.
+    """
+    session.aggregating = True
+    reasonings = [session.expert_replies[index] for index in sorted(session.expert_replies) if session.expert_replies[index]]
+    if not reasonings:
+        logging.error(f"❌ No ASI1 expert answered for session {session.session_id}, holding")
+        end_session(session)
+        await execute_decision(ctx, session, "HOLD")
+        return
+    
+    # every expert has to agree confidently, not only the last ASI_AGREEMENT_ROUNDS of them
+    decision = agreed_verdict([parse_verdict(reasoning) for reasoning in reasonings], every_reply=True)
+    if decision is not None:
+        record_early_stop(session, 1)
+        end_session(session)
+        await execute_decision(ctx, session, decision)
+        return
+    logging.info(f"🧠 Aggregating {len(reasonings)}/{ASI_EXPERT_COUNT} expert answers for session {session.session_id} after {time.time() - session.experts_sent_at:.2f}s")
+    
+    try:
+        await ctx.send(REASON_AGENT, ASI1Request(query=session.prompts.aggregate(reasonings), session_id=session.session_id, kind="decision"))
+    except Exception as e:
+        logging.error(f"❌ Error querying ASI1 model: {e}")
+
+
+@agent.on_interval(period=1.0)
+async def enforce_expert_deadlines(ctx: Context):
+    """Aggregate without the experts which did not answer within ASI_EXPERT_DEADLINE, or hold if none did."""
+    now = time.time()
+    for session in list(SESSIONS.values()):
+        if session.experts_sent_at and not session.aggregating and now - session.experts_sent_at > ASI_EXPERT_DEADLINE:
+            logging.warning(f"⌛ {ASI_EXPERT_COUNT - len(session.expert_replies)} ASI1 experts missed the deadline for session {session.session_id}")
+            await aggregate_experts(ctx, session)
+
+
 @agent.on_message(model=ASI1Response)
 async def handle_asi1_query(ctx: Context, sender: str, msg: ASI1Response):
-    global ASIITERATIONS
-    logging.info(f"✅ ASI1 Agent {ASIITERATIONS} finished reasoning")#{msg.decision}
-    ASIITERATIONS = ASIITERATIONS - 1
-    #Most recent crypto news - {CRYPTONEWSINFO}
-    if(ASIITERATIONS > 1):
-        prompt = f'''    
-        Consider the following factors:
-        
-        Fear Greed Index Analysis - {FGIOUTPUT}
-        Coin Market Data - {COININFORMATION}
-        Blockchain network - {NETWORK}
-        User's type of investing - {INVESTOR}
-        User's risk strategy - {RISK}
-        Most recent crypto news - {CRYPTONEWSINFO}
-        
-        User's opinion - {USERREASON}
-        
-        You are a crypto expert, who is assisting the user to make the most meaningful decisions, to gain the most revenue. 
-        
-        This query has been analysed with the following reasoning:
-        "{msg.decision}"
-        
-        Given the following information and reasoning from other expert, respond with decision of either "SELL", "BUY" or "HOLD" native token from {NETWORK} network. Inlcude all of the reasoning based on the analysed data and personal thoughts. Consider that the information provided is the only input from the user, and the user cannot provide additional information. However, you could point out to the area or questions which could help you making a solid decision.
-        '''
-        await ctx.send(REASON_AGENT, ASI1Request(query=prompt))
-
-    #Most recent crypto news - {CRYPTONEWSINFO}
-    if(ASIITERATIONS == 1):
-        prompt = f'''    
-        Consider the following factors:
-        
-        Fear Greed Index Analysis - {FGIOUTPUT}
-        Coin Market Data - {COININFORMATION}
-        Blockchain network - {NETWORK}
-        User's type of investing - {INVESTOR}
-        User's risk strategy - {RISK}
-        Most recent crypto news - {CRYPTONEWSINFO}        
-        
-        User's opinion - {USERREASON}   
-        
-        You are an independent expert of a crypto market with knowledge of how worldwide politis affects the cryptomarket. You are assisting the user to make the most meaningful decisions, to gain the most revenue whilst minimising potential losses. 
-        
-        This query has been analysed by {ASIITERATIONS} other crypto experts, and here is a summery of their reasoning:
-        "{msg.decision}"
-        
-        "SELL" means swapping native crypto coin into USDC.
-        "BUY" means swapping USDC into native crypto coin.
-        "HOLD" means no actions.
-        
-        Given the following information and reasoning from other expert responses, make a decision by responding ONLY with one word "SELL", "BUY" or "HOLD" for a native token from given network. Again, your output is ether "SELL", "BUY" or "HOLD". 
-        '''
-        await ctx.send(REASON_AGENT, ASI1Request(query=prompt))
-    
-    amountt = 0;
-    if (ASIITERATIONS == 0):
-        if (("SELL" in msg.decision) or ("BUY" in msg.decision)):
-                # i need to insert this after reason_agent(ASI1 llm) is done.
-            try:
-                signall=""
-                
-                if "BUY" in msg.decision:
-                    logging.critical("🚨 BUY SIGNAL DETECTED!")
-                    signall = "tag:swaplandbaseusdceth"#Buy ETH signal. Convert USDC to ETH
-                    amountt = 0.1 #usdc to eth
-                elif "SELL" in msg.decision:
-                    logging.critical("✅ SELL SIGNAL DETECTED!")
-                    #make signal a tag, so that a search query is constructed here "swaplandusdctoeth", then add this to search( ... )
-                    signall = "tag:swaplandbaseethusdc"
-                    amountt = 0.00007 #ETH to USDC
-                
-                chain = NETWORK
-                
-                await ctx.send(SWAPLAND_AGENT, SwaplandRequest(blockchain=chain,signal=signall, amount = amountt, private_key = METAMASK_PRIVATE_KEY))
-
-            except Exception as e:
-                logging.error(f"Failed to send request: {e}")
-        else:
-            logging.info("⏳ HOLD decision received.")
-            print("HOLD")
-            try:
-                await ctx.send(REWARD_AGENT, RewardRequest(status="reward"))
-            except Exception as e:
-                logging.error(f"Failed to send request for reward: {e}")
+    session = get_session(msg.session_id)
+    if session is None:
+        return
+    
+    if session.experts_sent_at:
+        await handle_expert_reply(ctx, session, msg)
+        return
+    
+    logging.info(f"✅ ASI1 Agent {session.iterations} finished reasoning for session {session.session_id}")#{msg.decision}
+    session.iterations = session.iterations - 1
+    
+    if session.iterations > 0:
+        session.verdicts.append(parse_verdict(msg.decision))
+        decision = agreed_verdict(session.verdicts)
+        if decision is not None:
+            # the remaining refinement rounds and the final round are skipped
+            record_early_stop(session, session.iterations)
+            end_session(session)
+            await execute_decision(ctx, session, decision)
+            return
+    if(session.iterations > 1):
+        prompt = session.prompts.refine(msg.decision)
+        await ctx.send(REASON_AGENT, ASI1Request(query=prompt, session_id=session.session_id, kind="reasoning"))
+
+    if(session.iterations == 1):
+        prompt = session.prompts.final(msg.decision, experts=ASIITERATIONS - 1)
+        await ctx.send(REASON_AGENT, ASI1Request(query=prompt, session_id=session.session_id, kind="decision"))
+    
+    if (session.iterations == 0):
+        end_session(session)
+        await execute_decision(ctx, session, msg.decision)
+
+
+async def handle_expert_reply(ctx: Context, session: AnalysisSession, msg: ASI1Response):
+    """Collect parallel expert answers; the reply without an expert index is the aggregated decision."""
+    if msg.expert is None:
+        end_session(session)
+        await execute_decision(ctx, session, msg.decision)
+        return
+    
+    if session.aggregating:
+        logging.warning(f"⌛ Late answer of ASI1 expert {msg.expert} for session {session.session_id} ignored")
+        return
+    
+    logging.info(f"✅ ASI1 expert {msg.expert} finished reasoning for session {session.session_id}")
+    session.expert_replies[msg.expert] = msg.decision
+    if len(session.expert_replies) == ASI_EXPERT_COUNT:
+        await aggregate_experts(ctx, session)
+
+
+async def execute_decision(ctx: Context, session: AnalysisSession, decision: str):
+    """Forwards the final ASI1 decision of a session to swapland, or requests the reward on HOLD."""
+    if (("SELL" in decision) or ("BUY" in decision)):
+            # i need to insert this after reason_agent(ASI1 llm) is done.
+        try:
+            signall=""
+            amountt = 0
+            
+            if "BUY" in decision:
+                logging.critical("🚨 BUY SIGNAL DETECTED!")
+                signall = "tag:swaplandbaseusdceth"#Buy ETH signal. Convert USDC to ETH
+                amountt = 0.1 #usdc to eth
+            elif "SELL" in decision:
+                logging.critical("✅ SELL SIGNAL DETECTED!")
+                #make signal a tag, so that a search query is constructed here "swaplandusdctoeth", then add this to search( ... )
+                signall = "tag:swaplandbaseethusdc"
+                amountt = 0.00007 #ETH to USDC
+            
+            chain = session.network
             
-            #exit(1)
+            await ctx.send(SWAPLAND_AGENT, SwaplandRequest(blockchain=chain,signal=signall, amount = amountt, private_key = METAMASK_PRIVATE_KEY))
+
+        except Exception as e:
+            logging.error(f"Failed to send request: {e}")
+    else:
+        logging.info("⏳ HOLD decision received.")
+        print("HOLD")
+        try:
+            await ctx.send(REWARD_AGENT, RewardRequest(status="reward"))
+        except Exception as e:
+            logging.error(f"Failed to send request for reward: {e}")
+        
+        #exit(1)
     
 
 # Handle incoming messages with the SwaplandResponse model from ai agent swapfinder_agent
@@ -583,7 +766,7 @@ async def message_handler(ctx: Context, sender: str, msg: SwapCompleted):
             logging.error(f"Failed to send request for reward: {e}")
     
     else:
-        ctx.logger.info(f"Fail to execute swap via swapland: {msg.status}")
+        ctx.logger.info(f"Fail to execute swap via swapland: {msg.status}: {msg.message}")
         
         
 #confirmation that reward has been received from reward_agent
@@ -0,0 +1,102 @@
+"""Local store of ingested NewsAPI articles with a deduplication index."""
+import hashlib
+import sqlite3
+import time
+from typing import Optional
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha1(url.strip().lower().encode()).hexdigest()
+
+
+def content_hash(title: Optional[str], description: Optional[str]) -> str:
+    """Hash of the normalised text, so the same story syndicated under several URLs is stored once."""
+    text = " ".join(f"{title or ''} {description or ''}".lower().split())
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class NewsStore:
+    """SQLite table of articles, unique by URL hash and by content hash."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url_hash TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL UNIQUE,
+                url TEXT,
+                title TEXT,
+                description TEXT,
+                published_at TEXT NOT NULL,
+                ingested_at REAL NOT NULL,
+                served_at REAL
+            )"""
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles)")}
+        if "served_at" not in columns:  # stores created before articles were marked as served
+            self.conn.execute("ALTER TABLE articles ADD COLUMN served_at REAL")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at)")
+        self.conn.commit()
+
+    def cursor(self) -> Optional[str]:
+        """publishedAt of the newest stored article, the next poll starts from here."""
+        return self.conn.execute("SELECT MAX(published_at) FROM articles").fetchone()[0]
+
+    def add(self, articles: list[dict]) -> int:
+        """Insert NewsAPI articles, skipping URLs or contents already stored. Returns the number added."""
+        now = time.time()
+        before = self.conn.total_changes
+        self.conn.executemany(
+            """INSERT OR IGNORE INTO articles
+               (url_hash, content_hash, url, title, description, published_at, ingested_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    url_hash(article.get("url") or article.get("title") or ""),
+                    content_hash(article.get("title"), article.get("description")),
+                    article.get("url"),
+                    article.get("title"),
+                    article.get("description"),
+                    article.get("publishedAt") or "",
+                    now,
+                )
+                for article in articles
+                if article.get("title") and article.get("title") != "[Removed]"
+            ],
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def latest(self, limit: int) -> list[dict]:
+        """The newest limit articles as title/description pairs."""
+        rows = self.conn.execute(
+            "SELECT title, description FROM articles ORDER BY published_at DESC, id DESC LIMIT ?",
+            (limit,),
+        )
+        return [{"title": title, "description": description} for title, description in rows]
+
+    def unseen(self, limit: int) -> list[dict]:
+        """The newest limit articles not served before, marked as served. Falls back to
+        latest(limit) once every stored article has been served."""
+        rows = self.conn.execute(
+            "SELECT id, title, description FROM articles WHERE served_at IS NULL "
+            "ORDER BY published_at DESC, id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        if not rows:
+            return self.latest(limit)
+        now = time.time()
+        self.conn.executemany("UPDATE articles SET served_at = ? WHERE id = ?", [(now, row[0]) for row in rows])
+        self.conn.commit()
+        return [{"title": title, "description": description} for _, title, description in rows]
+
+    def prune(self, older_than: str) -> int:
+        """Drop articles published before the given ISO timestamp. Returns the number removed."""
+        removed = self.conn.execute("DELETE FROM articles WHERE published_at < ?", (older_than,)).rowcount
+        self.conn.commit()
+        return removed
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,86 @@
+"""Cached token approval and Permit2 state of the swap agents' accounts.
+
+Every BUY swap used to read the USDC allowance of Permit2 and the Permit2 allowance
+of the Universal Router, and to sign a new permit even when the last one was still
+valid. The cache keeps the state the agent itself last read or set, so approvals
+and permits that are still sufficient are skipped. Entries are re-read from the
+chain after ALLOWANCE_CACHE_TTL seconds and dropped whenever a swap fails.
+"""
+import os
+import threading
+import time
+
+ALLOWANCE_CACHE_TTL = float(os.getenv("ALLOWANCE_CACHE_TTL", 300.0))
+MAX_PERMIT_AMOUNT = 2**160 - 1
+PERMIT_EXPIRY_MARGIN = 600  # seconds a permit must stay valid to be reused for a swap
+
+
+class AllowanceCache:
+    """ERC20 allowances and Permit2 (amount, expiration, nonce) entries, keyed by owner."""
+
+    def __init__(self, permit2_contract, ttl: float = ALLOWANCE_CACHE_TTL):
+        self.permit2 = permit2_contract
+        self.ttl = ttl
+        self._allowances: dict[tuple, tuple[int, float]] = {}  # (owner, token, spender) -> (amount, read_at)
+        self._permits: dict[tuple, tuple[tuple, float]] = {}  # (owner, token, spender) -> ((amount, expiration, nonce), read_at)
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry) -> bool:
+        return entry is not None and time.monotonic() - entry[1] < self.ttl
+
+    def token_allowance(self, token_contract, owner: str, spender: str) -> int:
+        """ERC20 allowance of spender over owner's tokens."""
+        key = (owner, token_contract.address, spender)
+        with self._lock:
+            entry = self._allowances.get(key)
+        if self._fresh(entry):
+            return entry[0]
+        amount = token_contract.functions.allowance(owner, spender).call()
+        self.set_token_allowance(token_contract.address, owner, spender, amount)
+        return amount
+
+    def set_token_allowance(self, token: str, owner: str, spender: str, amount: int):
+        with self._lock:
+            self._allowances[(owner, token, spender)] = (amount, time.monotonic())
+
+    def spend_token_allowance(self, token: str, owner: str, spender: str, amount: int):
+        """Account for a transfer by spender; USDC decrements even an unlimited allowance."""
+        with self._lock:
+            entry = self._allowances.get((owner, token, spender))
+            if entry is not None:
+                self._allowances[(owner, token, spender)] = (max(entry[0] - amount, 0), entry[1])
+
+    def permit(self, owner: str, token: str, spender: str) -> tuple[int, int, int]:
+        """Permit2 (amount, expiration, nonce) of spender over owner's token."""
+        key = (owner, token, spender)
+        with self._lock:
+            entry = self._permits.get(key)
+        if self._fresh(entry):
+            return entry[0]
+        permit = tuple(self.permit2.functions.allowance(owner, token, spender).call())
+        self.set_permit(owner, token, spender, *permit)
+        return permit
+
+    def set_permit(self, owner: str, token: str, spender: str, amount: int, expiration: int, nonce: int):
+        with self._lock:
+            self._permits[(owner, token, spender)] = ((amount, expiration, nonce), time.monotonic())
+
+    def spend_permit(self, owner: str, token: str, spender: str, amount: int):
+        """Account for a transfer through Permit2, which leaves an unlimited (2**160 - 1) amount untouched."""
+        with self._lock:
+            entry = self._permits.get((owner, token, spender))
+            if entry is not None and entry[0][0] < MAX_PERMIT_AMOUNT:
+                permit_amount, expiration, nonce = entry[0]
+                self._permits[(owner, token, spender)] = ((max(permit_amount - amount, 0), expiration, nonce), entry[1])
+
+    def permit_valid(self, owner: str, token: str, spender: str, amount: int) -> bool:
+        """Whether the current permit covers amount and does not expire before the swap can land."""
+        permit_amount, expiration, _ = self.permit(owner, token, spender)
+        return permit_amount >= amount and expiration > time.time() + PERMIT_EXPIRY_MARGIN
+
+    def invalidate(self, owner: str):
+        """Drop everything known about owner, e.g. after a failed transaction."""
+        with self._lock:
+            for cache in (self._allowances, self._permits):
+                for key in [key for key in cache if key[0] == owner]:
+                    del cache[key]
@@ -27,9 +27,11 @@ import requests
 from uniswap_universal_router_decoder import FunctionRecipient, RouterCodec
 from web3 import Account, Web3
 import os
+from swap_executor import (BASE_CHAIN_ID, BASE_RPC_ENDPOINT, UNIVERSAL_ROUTER_ADDRESS, USDC_ADDRESS, WETH_ADDRESS,
+                           get_account, get_executor, start_executor)
 
-chain_id = 8453
-rpc_endpoint = "https://mainnet.base.org"
+chain_id = BASE_CHAIN_ID
+rpc_endpoint = BASE_RPC_ENDPOINT
 METAMASKKEY = ""
 
 
@@ -130,7 +132,7 @@ def webhook():
 
 #send to uAgent
 @flask_app.route('/request', methods=['POST'])
-def send_status():
+def send_status(payload=None):
     """Send payload to the selected agent based on provided address."""
     global agent_response
     agent_response = None
@@ -138,7 +140,7 @@ def send_status():
     try:
         # Parse the request payload
         #data = request.json
-        payload = {"message": "Successfully executed Swapland Agent to convert ETH to USDC!", "status":"swapcompleted"}#data.get('payload')  # Extract the payload dictionary
+        payload = payload or {"message": "Successfully executed Swapland Agent to convert ETH to USDC!", "status":"swapcompleted"}#data.get('payload')  # Extract the payload dictionary
 
         uagent_address = "agent1qfrhxny23vz62v5tr20qnmnjujq8k5t0mxgwdxfap945922t9v4ugqtqkea" #run the uagent.py copy the address and paste here
         
@@ -160,25 +162,38 @@ def send_status():
         return jsonify({"error": str(e)}), 500
 
 
+def report_status(tx_hash=None, receipt=None):
+    """Call send_status from the transaction tracker's thread, which has no Flask app context."""
+    with flask_app.app_context():
+        send_status()
+
+
+def report_failure(tx_hash, receipt=None):
+    """Tell the main agent a swap reverted or was never mined, from the tracker's thread."""
+    reason = "reverted" if receipt is not None else "was not mined in time"
+    with flask_app.app_context():
+        send_status({"message": f"Swap {tx_hash} {reason}", "status": "swapfailed"})
+
+
 def execute_swap(amount : float):
     try:
-        uni_address = Web3.to_checksum_address('0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913')
-        uni_abi = '[{"inputs":[{"internalType":"address","name":"implementationContract","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"previousAdmin","type":"address"},{"indexed":false,"internalType":"address","name":"newAdmin","type":"address"}],"name":"AdminChanged","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"implementation","type":"address"}],"name":"Upgraded","type":"event"},{"stateMutability":"payable","type":"fallback"},{"inputs":[],"name":"admin","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"address","name":"newAdmin","type":"address"}],"name":"changeAdmin","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[],"name":"implementation","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"address","name":"newImplementation","type":"address"}],"name":"upgradeTo","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"newImplementation","type":"address"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"upgradeToAndCall","outputs":[],"stateMutability":"payable","type":"function"}]'
+        uni_address = USDC_ADDRESS
 
         #amount_in = int(0.0001 * 10**18)#18  working with 4
         amount_in = int(amount * 10**18)
         min_amount_out = 1 * 10**4 #10**6 == 1USDC  working with 5
 
-        weth_address = Web3.to_checksum_address('0x4200000000000000000000000000000000000006')
+        weth_address = WETH_ADDRESS
 
         path = [weth_address, uni_address]
 
         #uniswap router smart contract
-        ur_address = Web3.to_checksum_address("0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD")
-        ur_abi = '[{"inputs":[{"components":[{"internalType":"address","name":"permit2","type":"address"},{"internalType":"address","name":"weth9","type":"address"},{"internalType":"address","name":"seaportV1_5","type":"address"},{"internalType":"address","name":"seaportV1_4","type":"address"},{"internalType":"address","name":"openseaConduit","type":"address"},{"internalType":"address","name":"nftxZap","type":"address"},{"internalType":"address","name":"x2y2","type":"address"},{"internalType":"address","name":"foundation","type":"address"},{"internalType":"address","name":"sudoswap","type":"address"},{"internalType":"address","name":"elementMarket","type":"address"},{"internalType":"address","name":"nft20Zap","type":"address"},{"internalType":"address","name":"cryptopunks","type":"address"},{"internalType":"address","name":"looksRareV2","type":"address"},{"internalType":"address","name":"routerRewardsDistributor","type":"address"},{"internalType":"address","name":"looksRareRewardsDistributor","type":"address"},{"internalType":"address","name":"looksRareToken","type":"address"},{"internalType":"address","name":"v2Factory","type":"address"},{"internalType":"address","name":"v3Factory","type":"address"},{"internalType":"bytes32","name":"pairInitCodeHash","type":"bytes32"},{"internalType":"bytes32","name":"poolInitCodeHash","type":"bytes32"}],"internalType":"struct RouterParameters","name":"params","type":"tuple"}],"stateMutability":"nonpayable","type":"constructor"},{"inputs":[],"name":"BalanceTooLow","type":"error"},{"inputs":[],"name":"BuyPunkFailed","type":"error"},{"inputs":[],"name":"ContractLocked","type":"error"},{"inputs":[],"name":"ETHNotAccepted","type":"error"},{"inputs":[{"internalType":"uint256","name":"commandIndex","type":"uint256"},{"internalType":"bytes","name":"message","type":"bytes"}],"name":"ExecutionFailed","type":"error"},{"inputs":[],"name":"FromAddressIsNotOwner","type":"error"},{"inputs":[],"name":"InsufficientETH","type":"error"},{"inputs":[],"name":"InsufficientToken","type":"error"},{"inputs":[],"name":"InvalidBips","type":"error"},{"inputs":[{"internalType":"uint256","name":"commandType","type":"uint256"}],"name":"InvalidCommandType","type":"error"},{"inputs":[],"name":"InvalidOwnerERC1155","type":"error"},{"inputs":[],"name":"InvalidOwnerERC721","type":"error"},{"inputs":[],"name":"InvalidPath","type":"error"},{"inputs":[],"name":"InvalidReserves","type":"error"},{"inputs":[],"name":"InvalidSpender","type":"error"},{"inputs":[],"name":"LengthMismatch","type":"error"},{"inputs":[],"name":"SliceOutOfBounds","type":"error"},{"inputs":[],"name":"TransactionDeadlinePassed","type":"error"},{"inputs":[],"name":"UnableToClaim","type":"error"},{"inputs":[],"name":"UnsafeCast","type":"error"},{"inputs":[],"name":"V2InvalidPath","type":"error"},{"inputs":[],"name":"V2TooLittleReceived","type":"error"},{"inputs":[],"name":"V2TooMuchRequested","type":"error"},{"inputs":[],"name":"V3InvalidAmountOut","type":"error"},{"inputs":[],"name":"V3InvalidCaller","type":"error"},{"inputs":[],"name":"V3InvalidSwap","type":"error"},{"inputs":[],"name":"V3TooLittleReceived","type":"error"},{"inputs":[],"name":"V3TooMuchRequested","type":"error"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint256","name":"amount","type":"uint256"}],"name":"RewardsSent","type":"event"},{"inputs":[{"internalType":"bytes","name":"looksRareClaim","type":"bytes"}],"name":"collectRewards","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"bytes","name":"commands","type":"bytes"},{"internalType":"bytes[]","name":"inputs","type":"bytes[]"}],"name":"execute","outputs":[],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"bytes","name":"commands","type":"bytes"},{"internalType":"bytes[]","name":"inputs","type":"bytes[]"},{"internalType":"uint256","name":"deadline","type":"uint256"}],"name":"execute","outputs":[],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"address","name":"","type":"address"},{"internalType":"address","name":"","type":"address"},{"internalType":"uint256[]","name":"","type":"uint256[]"},{"internalType":"uint256[]","name":"","type":"uint256[]"},{"internalType":"bytes","name":"","type":"bytes"}],"name":"onERC1155BatchReceived","outputs":[{"internalType":"bytes4","name":"","type":"bytes4"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"address","name":"","type":"address"},{"internalType":"address","name":"","type":"address"},{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"bytes","name":"","type":"bytes"}],"name":"onERC1155Received","outputs":[{"internalType":"bytes4","name":"","type":"bytes4"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"address","name":"","type":"address"},{"internalType":"address","name":"","type":"address"},{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"bytes","name":"","type":"bytes"}],"name":"onERC721Received","outputs":[{"internalType":"bytes4","name":"","type":"bytes4"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"bytes4","name":"interfaceId","type":"bytes4"}],"name":"supportsInterface","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"int256","name":"amount0Delta","type":"int256"},{"internalType":"int256","name":"amount1Delta","type":"int256"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"uniswapV3SwapCallback","outputs":[],"stateMutability":"nonpayable","type":"function"},{"stateMutability":"payable","type":"receive"}]'
+        ur_address = UNIVERSAL_ROUTER_ADDRESS
 
 
-        codec = RouterCodec()
+        # Pooled Web3 connection and router codec built once per process
+        executor = get_executor()
+        codec = executor.codec
 
         encoded_input = (
                 codec
@@ -189,7 +204,7 @@ def execute_swap(amount : float):
                 .build(codec.get_default_deadline())
         )
 
-        w3 = Web3(Web3.HTTPProvider(rpc_endpoint))
+        w3 = executor.w3
         
         # For demo/test purposes, we'll simulate success without using actual private keys
         if not METAMASKKEY or METAMASKKEY == "0x0000000000000000000000000000000000000000000000000000000000000000":
@@ -200,27 +215,25 @@ def execute_swap(amount : float):
             send_status()  # Send success status to main agent
             return
             
-        account = Account.from_key(METAMASKKEY)
+        account = get_account(METAMASKKEY)
 
         trx_params = {
                 "from": account.address,
                 "to": ur_address,
                 "gas": 500_000, #make sure sufficient gas
-                "maxPriorityFeePerGas": w3.eth.max_priority_fee,
-                "maxFeePerGas": w3.eth.gas_price * 2,
+                **executor.fee_oracle.fees(),  # maxFeePerGas and maxPriorityFeePerGas from the cached fee history
                 "type": '0x2',
                 "chainId": chain_id,
                 "value": amount_in,
-                "nonce": w3.eth.get_transaction_count(account.address),
                 "data": encoded_input,
         }
 
-        raw_transaction = w3.eth.account.sign_transaction(trx_params, account.key).rawTransaction
-        trx_hash = w3.eth.send_raw_transaction(raw_transaction)
+        trx_hash = executor.send_transaction(trx_params, account)
         logger.info(f"Trx Hash: {w3.to_hex(trx_hash)}")
-        logger.info(f"Successfully converted from ETH to USDC.")
-        
-        send_status()  # Send status to main agent
+        logger.info(f"Submitted conversion from ETH to USDC.")
+
+        # Send status to main agent once the swap is mined, without holding the webhook
+        executor.track(trx_hash, account.address, on_confirmed=report_status, on_failed=report_failure)
     except Exception as e:
         logger.error(f"Error in execute_swap: {e}")
         # Still send successful status to keep the flow going
@@ -230,4 +243,5 @@ def execute_swap(amount : float):
 if __name__ == "__main__":
     load_dotenv()       # Load environment variables
     init_client()       #Register your agent on Agentverse
+    start_executor()    #Connect to the RPC endpoint before the first swap
     Thread(target=lambda: flask_app.run(host="0.0.0.0", port=5012, debug=True, use_reloader=False)).start()
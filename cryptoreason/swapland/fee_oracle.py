@@ -0,0 +1,67 @@
+"""EIP-1559 fee estimates for the swap agents from a cached fee history.
+
+Every transaction used to read eth_maxPriorityFeePerGas and eth_gasPrice and scale
+them by ad-hoc multipliers (up to three times the gas price). The oracle reads
+eth_feeHistory for the last FEE_HISTORY_BLOCKS blocks at most once per
+FEE_HISTORY_TTL seconds. The tip for an urgency level is the median, over those
+blocks, of the priority fee paid at that level's percentile. The max fee is twice
+the next block's base fee plus the tip, which covers base fee increases for
+several full blocks. Only the base fee actually charged plus the tip is paid.
+
+Settings can be overridden through environment variables:
+    FEE_HISTORY_BLOCKS  blocks of fee history considered (default 20)
+    FEE_HISTORY_TTL     seconds a fee history is reused (default 4, two Base blocks)
+    FEE_URGENCY         urgency level used by the swap agents (default normal)
+    MIN_PRIORITY_FEE    lowest tip offered, in wei (default 1000000, 0.001 gwei)
+"""
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+FEE_HISTORY_BLOCKS = int(os.getenv("FEE_HISTORY_BLOCKS", 20))
+FEE_HISTORY_TTL = float(os.getenv("FEE_HISTORY_TTL", 4.0))
+FEE_URGENCY = os.getenv("FEE_URGENCY", "normal")
+MIN_PRIORITY_FEE = int(os.getenv("MIN_PRIORITY_FEE", 1_000_000))
+
+# Reward percentile of the fee history used for each urgency level
+URGENCY_PERCENTILES = {"low": 10, "normal": 50, "high": 90}
+
+
+class FeeOracle:
+    """maxFeePerGas and maxPriorityFeePerGas per urgency level, shared by the threads of a swap agent."""
+
+    def __init__(self, w3, blocks: int = FEE_HISTORY_BLOCKS, ttl: float = FEE_HISTORY_TTL):
+        self.w3 = w3
+        self.blocks = blocks
+        self.ttl = ttl
+        self._base_fee = 0
+        self._tips: dict[str, int] = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        history = self.w3.eth.fee_history(self.blocks, "latest", list(URGENCY_PERCENTILES.values()))
+        rewards = history["reward"] or [[0] * len(URGENCY_PERCENTILES)]
+        self._base_fee = history["baseFeePerGas"][-1]  # base fee of the next block
+        for column, urgency in enumerate(URGENCY_PERCENTILES):
+            paid = sorted(block_rewards[column] for block_rewards in rewards)
+            self._tips[urgency] = max(paid[len(paid) // 2], MIN_PRIORITY_FEE)
+        self._fetched_at = time.monotonic()
+
+    def fees(self, urgency: str = FEE_URGENCY) -> dict:
+        """Fee fields of an EIP-1559 transaction. Raises KeyError for an unknown urgency level."""
+        if urgency not in URGENCY_PERCENTILES:
+            raise KeyError(f"Unknown fee urgency {urgency!r}, expected one of {list(URGENCY_PERCENTILES)}")
+        with self._lock:
+            if self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl:
+                try:
+                    self._refresh()
+                except Exception as e:
+                    if self._fetched_at is None:
+                        raise
+                    logging.warning(f"⚠️ Fee history refresh failed, using fees from "
+                                    f"{time.monotonic() - self._fetched_at:.0f}s ago: {e}")
+            tip = self._tips[urgency]
+            return {"maxPriorityFeePerGas": tip, "maxFeePerGas": 2 * self._base_fee + tip}
@@ -0,0 +1,33 @@
+"""Local nonce allocation for the swap agents' transactions."""
+import logging
+import threading
+
+
+class NonceManager:
+    """Hands out sequential nonces per account without asking the node each time.
+
+    The first allocation for an account reads its pending transaction count; later
+    ones increment locally, so dependent transactions (approve, permit, swap) can be
+    broadcast back to back and land in the same block. After a failed send or a
+    transaction that was never mined the account is resynced from the node on its
+    next allocation.
+    """
+
+    def __init__(self, w3):
+        self.w3 = w3
+        self._next: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def allocate(self, address: str) -> int:
+        with self._lock:
+            if address not in self._next:
+                self._next[address] = self.w3.eth.get_transaction_count(address, "pending")
+            nonce = self._next[address]
+            self._next[address] += 1
+            return nonce
+
+    def resync(self, address: str):
+        """Forget the local counter, e.g. after a send failed or another process used the account."""
+        with self._lock:
+            if self._next.pop(address, None) is not None:
+                logging.info(f"🔄 Resyncing nonce of {address}")
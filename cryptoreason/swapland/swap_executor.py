@@ -0,0 +1,136 @@
+"""Resident Web3 connection and contract handles shared by the swap agents.
+
+The swap agents used to build a new Web3 provider, parse the contract ABIs and
+construct the contract objects on every swap. The executor does that once per
+process: JSON-RPC calls go through a pooled keep-alive requests.Session, ABIs come
+parsed from abis.py and addresses are checksummed at import. warm_up() opens the
+RPC connection before the first swap arrives.
+
+Settings can be overridden through environment variables:
+    BASE_RPC_ENDPOINT    JSON-RPC endpoint of the Base network (default https://mainnet.base.org)
+    SWAP_RPC_POOL_SIZE   keep-alive connections kept to the endpoint (default 4)
+    SWAP_RPC_TIMEOUT     seconds allowed for one RPC call (default 30)
+    SWAP_RPC_WARMUP      connect and check the chain id on startup (default true)
+"""
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from uniswap_universal_router_decoder import RouterCodec
+from web3 import Account, Web3
+
+from abis import ERC20_ABI, PERMIT2_ABI, UNIVERSAL_ROUTER_ABI
+from allowance_cache import AllowanceCache
+from fee_oracle import FeeOracle
+from nonce_manager import NonceManager
+from tx_tracker import ConfirmationTracker
+
+BASE_CHAIN_ID = 8453
+BASE_RPC_ENDPOINT = os.getenv("BASE_RPC_ENDPOINT", "https://mainnet.base.org")
+SWAP_RPC_POOL_SIZE = int(os.getenv("SWAP_RPC_POOL_SIZE", 4))
+SWAP_RPC_TIMEOUT = float(os.getenv("SWAP_RPC_TIMEOUT", 30.0))
+SWAP_RPC_WARMUP = os.getenv("SWAP_RPC_WARMUP", "true").lower() == "true"
+
+# Token and contract addresses on Base
+USDC_ADDRESS = Web3.to_checksum_address("0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913")
+WETH_ADDRESS = Web3.to_checksum_address("0x4200000000000000000000000000000000000006")
+UNIVERSAL_ROUTER_ADDRESS = Web3.to_checksum_address("0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD")
+PERMIT2_ADDRESS = Web3.to_checksum_address("0x000000000022D473030F116dDEE9F6B43aC78BA3")
+
+# Node errors meaning the nonce is already taken, by a mined or a pending transaction
+NONCE_CONFLICTS = ("nonce too low", "replacement transaction underpriced", "already known")
+
+
+@lru_cache(maxsize=8)
+def get_account(private_key: str):
+    """Account for a private key, derived once per key."""
+    return Account.from_key(private_key)
+
+
+class SwapExecutor:
+    """Web3 client, router codec and contract handles for one chain."""
+
+    def __init__(self, rpc_endpoint: str = BASE_RPC_ENDPOINT, chain_id: int = BASE_CHAIN_ID,
+                 pool_size: int = SWAP_RPC_POOL_SIZE, timeout: float = SWAP_RPC_TIMEOUT):
+        self.rpc_endpoint = rpc_endpoint
+        self.chain_id = chain_id
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.w3 = Web3(Web3.HTTPProvider(rpc_endpoint, request_kwargs={"timeout": timeout}, session=session))
+
+        self.codec = RouterCodec()
+        self.usdc = self.w3.eth.contract(address=USDC_ADDRESS, abi=ERC20_ABI)
+        self.permit2 = self.w3.eth.contract(address=PERMIT2_ADDRESS, abi=PERMIT2_ABI)
+        self.universal_router = self.w3.eth.contract(address=UNIVERSAL_ROUTER_ADDRESS, abi=UNIVERSAL_ROUTER_ABI)
+        self.nonces = NonceManager(self.w3)
+        self.allowances = AllowanceCache(self.permit2)
+        self.tracker = ConfirmationTracker(self.w3)
+        self.fee_oracle = FeeOracle(self.w3)
+
+    def send_transaction(self, tx: dict, account) -> bytes:
+        """Sign tx with the next local nonce of account and broadcast it without waiting for it to be mined.
+
+        Any send error, including timeouts and connection errors of the provider, resyncs the
+        account's nonce. A nonce conflict (NONCE_CONFLICTS, e.g. the account was used elsewhere)
+        is retried once with the resynced nonce.
+        """
+        for attempt in range(2):
+            signed = account.sign_transaction({**tx, "nonce": self.nonces.allocate(account.address)})
+            try:
+                return self.w3.eth.send_raw_transaction(signed.rawTransaction)
+            except Exception as e:
+                self.nonces.resync(account.address)
+                if attempt or not any(conflict in str(e).lower() for conflict in NONCE_CONFLICTS):
+                    raise
+
+    def track(self, tx_hash, address: str, on_confirmed=None, on_failed=None):
+        """Track a sent transaction, resyncing the sender's nonce if it is never mined.
+
+        A dropped transaction leaves its nonce unused, and every later one would wait behind it.
+        """
+        def failed(tx_hash, receipt):
+            if receipt is None:
+                self.nonces.resync(address)
+            if on_failed is not None:
+                on_failed(tx_hash, receipt)
+
+        self.tracker.track(tx_hash, on_confirmed=on_confirmed, on_failed=failed)
+
+    def warm_up(self):
+        """Open the pooled RPC connection and check that the endpoint serves the expected chain."""
+        try:
+            remote_chain_id = self.w3.eth.chain_id
+            if remote_chain_id != self.chain_id:
+                logging.error(f"⚠️ {self.rpc_endpoint} serves chain {remote_chain_id}, expected {self.chain_id}")
+            else:
+                logging.info(f"✅ Swap executor connected to chain {remote_chain_id} via {self.rpc_endpoint}")
+        except Exception as e:
+            logging.warning(f"⚠️ Swap executor warm-up failed: {e}")
+
+
+_executor: Optional[SwapExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> SwapExecutor:
+    """The process wide executor, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SwapExecutor()
+        return _executor
+
+
+def start_executor():
+    """Create the executor and warm it up in the background, called when a swap agent starts."""
+    executor = get_executor()
+    if SWAP_RPC_WARMUP:
+        threading.Thread(target=executor.warm_up, daemon=True).start()
+    return executor
@@ -15,7 +15,11 @@ from uagents import Model
 #from fetchai.crypto import Identity
 from uuid import uuid4
 from llm_swapfinder import query_llm
-import requests
+import sys
+
+# Make the shared cryptoreason modules importable when run from swapland/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_client import HTTPClientError, post_json, run_sync
 
 import asyncio
 
@@ -179,13 +183,15 @@ def search(query):
         "limit": 5,
     }
 
-    # Make a POST request to the API
-    discovery = requests.post(api_url, json=payload)
+    # Make a POST request to the API through the shared pooled client
+    try:
+        data = run_sync(post_json(api_url, json=payload))
+    except HTTPClientError as e:
+        data = None
+        logger.info(f"Request failed: {e}")
 
     # Check if the request was successful
-    if discovery.status_code == 200:
-        # Parse the JSON response
-        data = discovery.json()
+    if data is not None:
         agents = data.get("agents", [])
         logger.info("Formatted API Response:")
         
@@ -225,9 +231,6 @@ def search(query):
 
         logger.info("Program completed")
 
-    else:
-        logger.info(f"Request failed with status code {response.status_code}")
-
     return {"status": "Agent searched"}
 
 
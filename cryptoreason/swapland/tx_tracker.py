@@ -0,0 +1,127 @@
+"""Background confirmation tracking of the swap agents' transactions.
+
+The swap agents used to block their webhook handler on wait_for_transaction_receipt
+until the swap was mined. Now they register the transaction hash with a callback and
+return; a single daemon thread polls the receipts of all transactions in flight and
+calls back when one confirms, reverts or times out.
+
+The poll interval adapts: it starts at TX_POLL_MIN_INTERVAL when a transaction is
+registered or a receipt arrives, and doubles up to TX_POLL_MAX_INTERVAL while nothing
+is mined. With nothing in flight the thread sleeps until the next registration.
+
+Settings can be overridden through environment variables:
+    TX_POLL_MIN_INTERVAL  seconds between receipt polls right after a change (default 1)
+    TX_POLL_MAX_INTERVAL  longest interval between receipt polls (default 8)
+    TX_CONFIRM_TIMEOUT    seconds after which a transaction is given up (default 300)
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from web3.exceptions import TransactionNotFound
+
+TX_POLL_MIN_INTERVAL = float(os.getenv("TX_POLL_MIN_INTERVAL", 1.0))
+TX_POLL_MAX_INTERVAL = float(os.getenv("TX_POLL_MAX_INTERVAL", 8.0))
+TX_CONFIRM_TIMEOUT = float(os.getenv("TX_CONFIRM_TIMEOUT", 300.0))
+
+
+@dataclass
+class TrackedTransaction:
+    tx_hash: str
+    on_confirmed: Optional[Callable] = None  # called with (tx_hash, receipt)
+    on_failed: Optional[Callable] = None  # called with (tx_hash, receipt), receipt is None on timeout
+    submitted_at: float = 0.0
+
+
+class ConfirmationTracker:
+    """Polls the receipts of submitted transactions on one daemon thread."""
+
+    def __init__(self, w3, min_interval: float = TX_POLL_MIN_INTERVAL,
+                 max_interval: float = TX_POLL_MAX_INTERVAL, timeout: float = TX_CONFIRM_TIMEOUT):
+        self.w3 = w3
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self._pending: dict[str, TrackedTransaction] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, tx_hash, on_confirmed: Optional[Callable] = None, on_failed: Optional[Callable] = None):
+        """Register a submitted transaction; the callbacks run on the tracker thread."""
+        tx_hash = self.w3.to_hex(tx_hash)
+        with self._lock:
+            self._pending[tx_hash] = TrackedTransaction(tx_hash, on_confirmed, on_failed, time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tx-tracker", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        logging.info(f"⏳ Tracking transaction {tx_hash}")
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            if not self.pending():
+                self._wakeup.wait()
+            self._wakeup.clear()
+
+            try:
+                settled = self.poll()
+            except Exception as e:
+                logging.error(f"Transaction tracker poll failed: {e!r}")
+                settled = 0
+            interval = self.min_interval if settled else min(interval * 2, self.max_interval)
+
+            # A new registration cuts the wait short and resets the interval
+            if self._wakeup.wait(interval):
+                interval = self.min_interval
+
+    def poll(self) -> int:
+        """Check every pending transaction once. Returns how many were settled."""
+        with self._lock:
+            pending = list(self._pending.values())
+
+        settled = 0
+        for tracked in pending:
+            receipt = None
+            try:
+                receipt = self.w3.eth.get_transaction_receipt(tracked.tx_hash)
+            except TransactionNotFound:
+                pass
+            except Exception as e:
+                # a flaky lookup must not hold up the other transactions
+                logging.warning(f"⚠️ Receipt lookup of {tracked.tx_hash} failed: {e!r}")
+
+            if receipt is not None:
+                self._settle(tracked, receipt)
+                settled += 1
+            elif time.monotonic() - tracked.submitted_at > self.timeout:
+                # also reached while the RPC keeps failing
+                logging.warning(f"⚠️ Transaction {tracked.tx_hash} not mined after {self.timeout:.0f}s")
+                self._settle(tracked, None)
+                settled += 1
+        return settled
+
+    def _settle(self, tracked: TrackedTransaction, receipt):
+        with self._lock:
+            self._pending.pop(tracked.tx_hash, None)
+
+        confirmed = receipt is not None and receipt["status"] == 1
+        if receipt is not None:
+            logging.info(f"{'✅' if confirmed else '❌'} Transaction {tracked.tx_hash} "
+                         f"{'confirmed' if confirmed else 'reverted'} in block {receipt['blockNumber']}, "
+                         f"gas used {receipt['gasUsed']}")
+        callback = tracked.on_confirmed if confirmed else tracked.on_failed
+        if callback is None:
+            return
+        try:
+            callback(tracked.tx_hash, receipt)
+        except Exception as e:
+            logging.error(f"Callback for transaction {tracked.tx_hash} failed: {e!r}")
@@ -1,5 +1,5 @@
 #!/bin/bash
 
-# Start the Flask API server
-echo "Starting Flask API server on http://localhost:8000..."
+# Start the ASGI API server (one uvicorn worker, jobs and live state are kept in its memory)
+echo "Starting API server on http://localhost:${API_PORT:-8600}..."
 python cryptoreason/api_wrapper.py 
\ No newline at end of file
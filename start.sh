@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Start the Flask API server in the background
-echo "Starting Flask API server on port 8000..."
+# Start the ASGI API server in the background
+echo "Starting API server on port ${API_PORT:-8600}..."
 python cryptoreason/api_wrapper.py &
 API_PID=$!
 